@@ -156,7 +156,6 @@ class AICompletionService:
                 planning.AgentConfig,
                 proto_user_id=self._proto_user_id,
             )
-            agents = cast(list[planning.AgentConfig], agents)
 
             if not agents:
                 logger.debug("No agent configurations found in database")
@@ -245,12 +244,9 @@ class AICompletionService:
     def get_all_agents(self) -> list[planning.AgentConfig]:
         """Get all configured agents."""
         try:
-            return cast(
-                list[planning.AgentConfig],
-                content_api.retrieve_objects(
-                    planning.AgentConfig,
-                    proto_user_id=self._proto_user_id,
-                ),
+            return content_api.retrieve_objects(
+                planning.AgentConfig,
+                proto_user_id=self._proto_user_id,
             )
         except Exception as e:
             logger.error("Error retrieving agents: %s", e)
@@ -1,12 +1,12 @@
 # from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from functools import wraps
-from typing import Callable, ParamSpec, Sequence, TypeVar, cast
+from typing import Callable, Iterable, ParamSpec, Sequence, TypeVar, cast
 
 from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from ..util import get_basic_logger
-from . import planning
+from . import executing, planning
 from .database import get_session_factory
 from .models import ObjectBase, ObjectID, PydanticToSQLModel
 
@@ -17,6 +17,7 @@ logger = get_basic_logger(__name__)
 # TODO: Find more elegant way to type this
 T = TypeVar("T")
 P = ParamSpec("P")
+ObjectT = TypeVar("ObjectT", bound=planning.Object)
 
 
 def perform_w_session(f: Callable[P, T]) -> Callable[P, T]:
@@ -317,25 +318,78 @@ def retrieve_object(
 
 @perform_w_session
 def retrieve_objects(
-    obj_type: type[planning.Object],
+    obj_type: type[ObjectT],
     session: Session | None = None,
     proto_user_id: int = 0,
-) -> list[planning.Object]:
-    """Retrieve all objects of a specific type."""
+) -> list[ObjectT]:
+    """Retrieve all objects of a specific type, in creation order."""
     session = cast(Session, session)  # for mypy
     sql_model = cast(type[ObjectBase], PydanticToSQLModel[obj_type])
-    prefix = obj_type._default_prefix
 
-    # Get all IDs for this type
-    db_ids = _retrieve_ids(prefix=prefix, proto_user_id=proto_user_id, session=session)
+    # One joined SELECT for the whole type rather than one per ID
+    db_objs = session.execute(
+        select(sql_model)
+        .join(ObjectID, ObjectID.id == sql_model.id)
+        .where(
+            ObjectID.proto_user_id == proto_user_id,
+            ObjectID.prefix == obj_type._default_prefix,
+        )
+        .order_by(ObjectID.id)
+    ).scalars()
+    return [cast(ObjectT, db_obj.to_pydantic(session=session)) for db_obj in db_objs]
+
 
-    results = []
-    for db_id in db_ids:
-        db_obj = session.execute(select(sql_model).where(sql_model.id == db_id.id)).scalars().first()
-        if db_obj:
-            results.append(db_obj.to_pydantic(session=session))
+@perform_w_session
+def retrieve_campaign_summaries(
+    session: Session | None = None,
+    proto_user_id: int = 0,
+) -> list[tuple[planning.ID, str, str]]:
+    """
+    Retrieve (obj_id, title, summary) for every campaign plan owned by the user.
 
-    return results
+    Only those columns are read, so no nested campaign content is loaded;
+    use retrieve_object to hydrate the campaign the user picks.
+    """
+    session = cast(Session, session)  # for mypy
+    sql_model = cast(type[ObjectBase], PydanticToSQLModel[planning.CampaignPlan])
+    rows = session.execute(
+        select(ObjectID.prefix, ObjectID.numeric, sql_model.title, sql_model.summary)  # type: ignore[attr-defined]
+        .join(ObjectID, ObjectID.id == sql_model.id)
+        .where(
+            ObjectID.proto_user_id == proto_user_id,
+            ObjectID.prefix == planning.CampaignPlan._default_prefix,
+        )
+        .order_by(ObjectID.id)
+    )
+    return [(planning.ID(prefix=prefix, numeric=numeric), title, summary) for prefix, numeric, title, summary in rows]
+
+
+@perform_w_session
+def retrieve_execution_summaries(
+    session: Session | None = None,
+    proto_user_id: int = 0,
+) -> list[tuple[planning.ID, str, str]]:
+    """
+    Retrieve (obj_id, title, session_date) for every campaign execution owned by the user.
+
+    Only those columns are read, so no session notes or entries are loaded;
+    use retrieve_object to hydrate the execution the user picks.
+    """
+    session = cast(Session, session)  # for mypy
+    sql_model = cast(type[ObjectBase], PydanticToSQLModel[executing.CampaignExecution])
+    rows = session.execute(
+        select(ObjectID.prefix, ObjectID.numeric, sql_model.title, sql_model.session_date)  # type: ignore[attr-defined]
+        .join(ObjectID, ObjectID.id == sql_model.id)
+        .where(
+            ObjectID.proto_user_id == proto_user_id,
+            ObjectID.prefix == executing.CampaignExecution._default_prefix,
+        )
+        .order_by(ObjectID.id)
+    )
+    return [
+        (planning.ID(prefix=prefix, numeric=numeric), title, session_date)
+        for prefix, numeric, title, session_date in rows
+    ]
 
 
 @perform_w_session
@@ -380,6 +434,25 @@ def update_object(
     return db_obj.to_pydantic(session=session)
 
 
+@perform_w_session
+def bulk_update_objects(
+    objs: Iterable[planning.Object],
+    session: Session | None = None,
+    proto_user_id: int = 0,
+    auto_commit: bool = True,
+) -> list[planning.Object]:
+    """
+    Update several existing objects in a single transaction.
+
+    Either every object is updated or, if any of them is missing, none are.
+
+    This is a top-level API function that commits the transaction by default.
+    Pass auto_commit=False when using within a larger transaction context.
+    """
+    session = cast(Session, session)  # for mypy
+    return [update_object(obj, proto_user_id=proto_user_id, session=session, auto_commit=False) for obj in objs]
+
+
 @perform_w_session
 def delete_object(
     obj_id: planning.ID,
@@ -419,3 +492,131 @@ def delete_object(
     session.delete(db_obj)
     # REMOVED: session.commit() - Let decorator handle commit
     return True
+
+
+@perform_w_session
+def delete_objects(
+    obj_ids: Iterable[planning.ID],
+    session: Session | None = None,
+    proto_user_id: int = 0,
+    auto_commit: bool = True,
+) -> int:
+    """
+    Delete several objects by ID in a single transaction.
+
+    This is a top-level API function that commits the transaction by default.
+    Pass auto_commit=False when using within a larger transaction context.
+
+    Returns the number of objects that were found and deleted.
+    """
+    session = cast(Session, session)  # for mypy
+    return sum(
+        delete_object(obj_id, proto_user_id=proto_user_id, session=session, auto_commit=False) for obj_id in obj_ids
+    )
+
+
+@perform_w_session
+def retrieve_enabled_agents(
+    session: Session | None = None,
+    proto_user_id: int = 0,
+) -> list[planning.AgentConfig]:
+    """
+    Retrieve the user's enabled AgentConfigs in creation order.
+
+    Disabled agents are filtered out by the database, so they are never loaded or validated.
+    """
+    session = cast(Session, session)  # for mypy
+    sql_model = cast(type[ObjectBase], PydanticToSQLModel[planning.AgentConfig])
+    db_objs = session.execute(
+        select(sql_model)
+        .join(ObjectID, ObjectID.id == sql_model.id)
+        .where(
+            ObjectID.proto_user_id == proto_user_id,
+            ObjectID.prefix == planning.AgentConfig._default_prefix,
+            sql_model.is_enabled.is_(True),  # type: ignore[attr-defined]
+        )
+        .order_by(ObjectID.id)
+    ).scalars()
+    return [cast(planning.AgentConfig, db_obj.to_pydantic(session=session)) for db_obj in db_objs]
+
+
+@perform_w_session
+def unset_default_agents(
+    except_id: planning.ID | None = None,
+    session: Session | None = None,
+    proto_user_id: int = 0,
+    auto_commit: bool = True,
+) -> int:
+    """
+    Clear the is_default flag on every AgentConfig owned by the user, in a single UPDATE.
+
+    Pass except_id to leave that agent untouched (e.g. the one being made default).
+
+    This is a top-level API function that commits the transaction by default.
+    Pass auto_commit=False when using within a larger transaction context.
+
+    Returns the number of agents whose flag was cleared.
+    """
+    session = cast(Session, session)  # for mypy
+    sql_model = cast(type[ObjectBase], PydanticToSQLModel[planning.AgentConfig])
+    owned_ids = select(ObjectID.id).where(
+        ObjectID.proto_user_id == proto_user_id,
+        ObjectID.prefix == planning.AgentConfig._default_prefix,
+    )
+    if except_id is not None:
+        owned_ids = owned_ids.where(ObjectID.numeric != except_id.numeric)
+    result = session.execute(
+        update(sql_model)
+        .where(sql_model.id.in_(owned_ids), sql_model.is_default.is_(True))  # type: ignore[attr-defined]
+        .values(is_default=False)
+    )
+    return result.rowcount
+
+
+@perform_w_session
+def set_default_agent(
+    agent_id: planning.ID,
+    session: Session | None = None,
+    proto_user_id: int = 0,
+    auto_commit: bool = True,
+) -> bool:
+    """
+    Make the given AgentConfig the user's only default, touching at most the old and new default rows.
+
+    This is a top-level API function that commits the transaction by default.
+    Pass auto_commit=False when using within a larger transaction context.
+
+    Returns True if the agent was found and flagged as default.
+    """
+    session = cast(Session, session)  # for mypy
+    unset_default_agents(except_id=agent_id, session=session, proto_user_id=proto_user_id, auto_commit=False)
+    sql_model = cast(type[ObjectBase], PydanticToSQLModel[planning.AgentConfig])
+    target_id = select(ObjectID.id).where(
+        ObjectID.proto_user_id == proto_user_id,
+        ObjectID.prefix == agent_id.prefix,
+        ObjectID.numeric == agent_id.numeric,
+    )
+    result = session.execute(
+        update(sql_model).where(sql_model.id.in_(target_id)).values(is_default=True)  # type: ignore[attr-defined]
+    )
+    return result.rowcount == 1
+
+
+@perform_w_session
+def update_agent(
+    agent: planning.AgentConfig,
+    session: Session | None = None,
+    proto_user_id: int = 0,
+    auto_commit: bool = True,
+) -> planning.AgentConfig:
+    """
+    Update an existing AgentConfig; if it is flagged as default, clear every other default in the same transaction.
+
+    This is a top-level API function that commits the transaction by default.
+    Pass auto_commit=False when using within a larger transaction context.
+    """
+    session = cast(Session, session)  # for mypy
+    if agent.is_default:
+        unset_default_agents(except_id=agent.obj_id, session=session, proto_user_id=proto_user_id, auto_commit=False)
+    update_object(agent, session=session, proto_user_id=proto_user_id, auto_commit=False)
+    return agent
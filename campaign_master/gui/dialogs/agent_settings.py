@@ -2,9 +2,10 @@
 Agent Settings Dialog for configuring AI completion providers.
 """
 
-from typing import cast
+import os
+from typing import Callable, cast
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from campaign_master.ai import AICompletionService
 from campaign_master.ai.providers import get_available_provider_types, get_provider
@@ -14,10 +15,148 @@ from campaign_master.util import get_basic_logger
 
 logger = get_basic_logger(__name__)
 
+TEST_CONNECTION_THROTTLE_MS = 500
+"""Minimum interval between connection probes, so rapid clicks don't queue up requests."""
+
+_BASE_URL_PLACEHOLDERS: dict[str, str] = {
+    "ollama": "http://localhost:11434",
+}
+"""Base URL placeholder per provider type, for providers that need a base URL."""
+
+_DEFAULT_BASE_URL_PLACEHOLDER = "Optional: Override API base URL"
+
+
+def _resolve_api_key(raw: str) -> tuple[str, str | None]:
+    """
+    Resolve a "$ENV_VAR" API key reference.
+
+    Returns (api_key, error); error is None unless the referenced variable is unset.
+    """
+    if not raw.startswith("$"):
+        return raw, None
+    env_var = raw[1:]
+    api_key = os.environ.get(env_var, "")
+    if not api_key:
+        return "", f"Environment variable {env_var} not set"
+    return api_key, None
+
+
+class _ConnectionTestSignals(QtCore.QObject):
+    """Signals emitted by ConnectionTestWorker (QRunnable cannot emit signals itself)."""
+
+    finished = QtCore.Signal(bool, str)  # success, message
+
+
+class ConnectionTestWorker(QtCore.QRunnable):
+    """Probes a provider connection on a QThreadPool thread."""
+
+    def __init__(self, provider_type: str, api_key: str, base_url: str, model: str):
+        super().__init__()
+        self.signals = _ConnectionTestSignals()
+        self._provider_type = provider_type
+        self._api_key = api_key
+        self._base_url = base_url
+        self._model = model
+
+    def run(self):
+        """Execute the connection test."""
+        try:
+            success, message = AICompletionService.instance().test_connection(
+                self._provider_type, self._api_key, self._base_url, self._model
+            )
+        except Exception as e:
+            logger.error("Connection test worker error: %s", e)
+            success, message = False, str(e)
+        self.signals.finished.emit(success, message)
+
+
+class LazyModelComboBox(QtWidgets.QComboBox):
+    """Editable model combo box that only fetches its model list when the popup is first opened."""
+
+    def __init__(self, load_models: Callable[[str], list[str]], parent=None):
+        super().__init__(parent)
+        self.setEditable(True)  # Allow custom model names
+        # Swapping a string list avoids per-item QStandardItem allocation on every provider switch
+        self._model_names = QtCore.QStringListModel(self)
+        self.setModel(self._model_names)
+        self._load_models = load_models
+        self._pending_provider: str | None = None
+
+    def set_provider_type(self, provider_type: str):
+        """Drop the current items and defer loading the models for a new provider."""
+        self._model_names.setStringList([])
+        self.clearEditText()
+        self._pending_provider = provider_type or None
+
+    def ensure_populated(self):
+        """Fill in the model list for the pending provider, keeping the current text."""
+        if self._pending_provider is None:
+            return
+        provider_type, self._pending_provider = self._pending_provider, None
+        current_text = self.currentText()
+        # Swapping the list and restoring the text would emit currentTextChanged for
+        # intermediate values; listeners must not see that as an edit
+        with QtCore.QSignalBlocker(self):
+            self._model_names.setStringList(self._load_models(provider_type))
+            if current_text:
+                self.setCurrentText(current_text)
+
+    def showPopup(self):
+        self.ensure_populated()
+        super().showPopup()
+
+
+class AgentListModel(QtCore.QAbstractListModel):
+    """List model exposing AgentConfig objects to a QListView, rendered on demand."""
+
+    def __init__(self, disabled_brush: QtGui.QBrush, parent=None):
+        super().__init__(parent)
+        self._agents: list[planning.AgentConfig] = []
+        self._disabled_brush = disabled_brush
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._agents)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        agent = self._agents[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            name = agent.name or "(unnamed)"
+            return f"{name} (default)" if agent.is_default else name
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return agent
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole and not agent.is_enabled:
+            return self._disabled_brush
+        return None
+
+    def set_agents(self, agents: list[planning.AgentConfig]):
+        """Replace the model contents; the list is shared, not copied."""
+        self.beginResetModel()
+        self._agents = agents
+        self.endResetModel()
+
+    def append_agent(self, agent: planning.AgentConfig) -> QtCore.QModelIndex:
+        """Add an agent at the end of the list and return its index."""
+        row = len(self._agents)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._agents.append(agent)
+        self.endInsertRows()
+        return self.index(row)
+
+    def remove_agent(self, row: int):
+        """Remove the agent at the given row."""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._agents.pop(row)
+        self.endRemoveRows()
+
 
 class AgentSettingsDialog(QtWidgets.QDialog):
     """Dialog for configuring AI agents."""
 
+    _models_cache: dict[str, list[str]] = {}
+    """Available models per provider type, shared across dialog instances."""
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Configure AI Agents")
@@ -26,6 +165,14 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self._proto_user_id = 0  # GUI uses global scope
         self._current_agent: planning.AgentConfig | None = None
         self._agents: list[planning.AgentConfig] = []
+        # Signals of the connection test in flight; the pool owns and frees the worker itself
+        self._test_signals: _ConnectionTestSignals | None = None
+        self._form_built = False
+        self._last_provider_type: str | None = None
+        self._dirty = False
+        self._disabled_agent_brush = QtWidgets.QApplication.palette().brush(
+            QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text
+        )
 
         self.init_ui()
         self.load_agents()
@@ -36,8 +183,30 @@ class AgentSettingsDialog(QtWidgets.QDialog):
 
         # Create splitter for list and form
         splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Horizontal)
+        splitter.addWidget(self._build_left())
+
+        # Right side - placeholder until an agent is selected; the form is built on demand
+        self.form_stack = QtWidgets.QStackedWidget()
+        placeholder = QtWidgets.QLabel("Select or add an agent to configure it.")
+        placeholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.form_stack.addWidget(placeholder)
+        splitter.addWidget(self.form_stack)
+
+        # Set splitter sizes
+        splitter.setSizes([200, 500])
 
-        # Left side - agent list
+        main_layout.addWidget(splitter)
+
+        # Dialog buttons
+        button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Save | QtWidgets.QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self.save_and_close)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def _build_left(self) -> QtWidgets.QWidget:
+        """Build the agent list and its Add/Remove buttons."""
         left_widget = QtWidgets.QWidget()
         left_layout = QtWidgets.QVBoxLayout(left_widget)
         left_layout.setContentsMargins(0, 0, 0, 0)
@@ -45,8 +214,10 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         list_label = QtWidgets.QLabel("Configured Agents:")
         left_layout.addWidget(list_label)
 
-        self.agent_list = QtWidgets.QListWidget()
-        self.agent_list.itemSelectionChanged.connect(self.on_agent_selected)
+        self.agent_model = AgentListModel(self._disabled_agent_brush, self)
+        self.agent_list = QtWidgets.QListView()
+        self.agent_list.setModel(self.agent_model)
+        self.agent_list.selectionModel().selectionChanged.connect(self.on_agent_selected)
         left_layout.addWidget(self.agent_list)
 
         # List buttons
@@ -60,9 +231,10 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         list_buttons.addWidget(self.remove_button)
         left_layout.addLayout(list_buttons)
 
-        splitter.addWidget(left_widget)
+        return left_widget
 
-        # Right side - configuration form
+    def _build_right(self) -> QtWidgets.QWidget:
+        """Build the agent configuration form."""
         right_widget = QtWidgets.QWidget()
         right_layout = QtWidgets.QVBoxLayout(right_widget)
         right_layout.setContentsMargins(10, 0, 0, 0)
@@ -88,18 +260,22 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self.provider_combo = QtWidgets.QComboBox()
         self.provider_combo.addItems(get_available_provider_types())
         self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
-        form_layout.addRow("Provider:", self.provider_combo)
+        self.refresh_models_button = QtWidgets.QPushButton("Refresh")
+        self.refresh_models_button.setToolTip("Re-fetch the available models for this provider")
+        self.refresh_models_button.clicked.connect(self.refresh_models)
+        provider_row = QtWidgets.QHBoxLayout()
+        provider_row.addWidget(self.provider_combo, 1)
+        provider_row.addWidget(self.refresh_models_button)
+        form_layout.addRow("Provider:", provider_row)
 
         # Model selection
-        self.model_combo = QtWidgets.QComboBox()
-        self.model_combo.setEditable(True)  # Allow custom model names
+        self.model_combo = LazyModelComboBox(self.get_available_models)
         form_layout.addRow("Model:", self.model_combo)
 
         # API Key
         self.api_key_edit = QtWidgets.QLineEdit()
         self.api_key_edit.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
         self.api_key_edit.setPlaceholderText("sk-... or $ENV_VAR_NAME")
-        form_layout.addRow("API Key:", self.api_key_edit)
 
         # Show/hide API key button
         show_key_button = QtWidgets.QPushButton("Show")
@@ -113,7 +289,7 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         api_key_row = QtWidgets.QHBoxLayout()
         api_key_row.addWidget(self.api_key_edit)
         api_key_row.addWidget(show_key_button)
-        form_layout.addRow("", api_key_row)
+        form_layout.addRow("API Key:", api_key_row)
 
         # Base URL
         self.base_url_edit = QtWidgets.QLineEdit()
@@ -160,36 +336,52 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self.test_button.clicked.connect(self.test_connection)
         right_layout.addWidget(self.test_button)
 
+        self._test_throttle = QtCore.QTimer(self)
+        self._test_throttle.setSingleShot(True)
+        self._test_throttle.setInterval(TEST_CONNECTION_THROTTLE_MS)
+
         # Status label
         self.status_label = QtWidgets.QLabel("")
         self.status_label.setWordWrap(True)
         right_layout.addWidget(self.status_label)
 
-        splitter.addWidget(right_widget)
-
-        # Set splitter sizes
-        splitter.setSizes([200, 500])
-
-        main_layout.addWidget(splitter)
-
-        # Dialog buttons
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.StandardButton.Save | QtWidgets.QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self.save_and_close)
-        button_box.rejected.connect(self.reject)
-        main_layout.addWidget(button_box)
-
         # Apply initial provider change
         self.on_provider_changed(self.provider_combo.currentText())
 
-        # Disable form until agent selected
-        self.set_form_enabled(False)
+        # Track edits so an untouched agent is not written back on save
+        for signal in (
+            self.name_edit.textChanged,
+            self.provider_combo.currentTextChanged,
+            self.model_combo.currentTextChanged,
+            self.api_key_edit.textChanged,
+            self.base_url_edit.textChanged,
+            self.temperature_spin.valueChanged,
+            self.max_tokens_spin.valueChanged,
+            self.system_prompt_edit.textChanged,
+            self.default_checkbox.toggled,
+            self.enabled_checkbox.toggled,
+        ):
+            signal.connect(self._mark_dirty)
+
+        return right_widget
+
+    def _mark_dirty(self, *_):
+        """Record that the form differs from the stored agent."""
+        self._dirty = True
+
+    def _ensure_form(self):
+        """Build the configuration form the first time an agent is selected."""
+        if self._form_built:
+            return
+        self.form_stack.addWidget(self._build_right())
+        self.form_stack.setCurrentIndex(1)
+        self._form_built = True
 
     def set_form_enabled(self, enabled: bool):
         """Enable or disable the configuration form."""
         self.name_edit.setEnabled(enabled)
         self.provider_combo.setEnabled(enabled)
+        self.refresh_models_button.setEnabled(enabled)
         self.model_combo.setEnabled(enabled)
         self.api_key_edit.setEnabled(enabled)
         self.base_url_edit.setEnabled(enabled)
@@ -198,43 +390,33 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self.system_prompt_edit.setEnabled(enabled)
         self.default_checkbox.setEnabled(enabled)
         self.enabled_checkbox.setEnabled(enabled)
-        self.test_button.setEnabled(enabled)
+        self.test_button.setEnabled(enabled and self._test_signals is None)
 
     def load_agents(self):
         """Load agents from database."""
-        self._agents = cast(
-            list[planning.AgentConfig],
-            content_api.retrieve_objects(
-                planning.AgentConfig,
-                proto_user_id=self._proto_user_id,
-            ),
-        )
+        self._agents = content_api.retrieve_objects(planning.AgentConfig, proto_user_id=self._proto_user_id)
 
-        self.agent_list.clear()
-        for agent in self._agents:
-            item = QtWidgets.QListWidgetItem(agent.name or "(unnamed)")
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, agent)
-            if agent.is_default:
-                item.setText(f"{agent.name or '(unnamed)'} (default)")
-            if not agent.is_enabled:
-                palette = QtWidgets.QApplication.palette()
-                item.setForeground(palette.text())
-            self.agent_list.addItem(item)
+        # A model reset repaints once and drops the selection without per-row signals
+        self.agent_model.set_agents(self._agents)
+        self.on_agent_selected()
 
     def on_agent_selected(self):
         """Handle agent selection change."""
-        items = self.agent_list.selectedItems()
-        if not items:
+        self.cancel_test_connection()
+        indexes = self.agent_list.selectionModel().selectedIndexes()
+        if not indexes:
             self._current_agent = None
             self.remove_button.setEnabled(False)
-            self.set_form_enabled(False)
-            self.clear_form()
+            if self._form_built:
+                self.set_form_enabled(False)
+                self.clear_form()
             return
 
+        self._ensure_form()
         self.remove_button.setEnabled(True)
         self.set_form_enabled(True)
 
-        agent: planning.AgentConfig = items[0].data(QtCore.Qt.ItemDataRole.UserRole)
+        agent: planning.AgentConfig = indexes[0].data(QtCore.Qt.ItemDataRole.UserRole)
         self._current_agent = agent
         self.populate_form(agent)
 
@@ -247,7 +429,7 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         if idx >= 0:
             self.provider_combo.setCurrentIndex(idx)
 
-        # Set model after provider (so list is populated)
+        # Set model after provider; the model list itself is loaded when the popup opens
         self.model_combo.setCurrentText(agent.model)
 
         self.api_key_edit.setText(agent.api_key)
@@ -259,12 +441,13 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self.enabled_checkbox.setChecked(agent.is_enabled)
 
         self.status_label.setText("")
+        self._dirty = False
 
     def clear_form(self):
         """Clear the configuration form."""
         self.name_edit.clear()
         self.provider_combo.setCurrentIndex(0)
-        self.model_combo.clear()
+        self.model_combo.clearEditText()  # Keep the items, which still match the provider
         self.api_key_edit.clear()
         self.base_url_edit.clear()
         self.temperature_spin.setValue(0.7)
@@ -273,28 +456,42 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self.default_checkbox.setChecked(False)
         self.enabled_checkbox.setChecked(True)
         self.status_label.setText("")
+        self._dirty = False
 
     def on_provider_changed(self, provider_type: str):
         """Handle provider type change - update available models."""
-        self.model_combo.clear()
+        if provider_type == self._last_provider_type:
+            return
+        self._last_provider_type = provider_type
+        self.model_combo.set_provider_type(provider_type)
 
         if not provider_type:
             return
 
-        try:
-            provider = get_provider(provider_type)
-            models = provider.get_available_models()
-            self.model_combo.addItems(models)
-        except Exception as e:
-            logger.warning("Could not get models for %s: %s", provider_type, e)
-
-        # Show/hide base URL based on provider
-        is_ollama = provider_type == "ollama"
-        self.base_url_edit.setVisible(True)
-        if is_ollama:
-            self.base_url_edit.setPlaceholderText("http://localhost:11434")
-        else:
-            self.base_url_edit.setPlaceholderText("Optional: Override API base URL")
+        # Base URL hint depends on the provider
+        self.base_url_edit.setPlaceholderText(_BASE_URL_PLACEHOLDERS.get(provider_type, _DEFAULT_BASE_URL_PLACEHOLDER))
+
+    @classmethod
+    def get_available_models(cls, provider_type: str) -> list[str]:
+        """Return the models for a provider type, querying the provider only on a cache miss."""
+        models = cls._models_cache.get(provider_type)
+        if models is None:
+            try:
+                models = get_provider(provider_type).get_available_models()
+            except Exception as e:
+                logger.warning("Could not get models for %s: %s", provider_type, e)
+                return []
+            cls._models_cache[provider_type] = models
+        return models
+
+    def refresh_models(self):
+        """Drop the cached model list for the current provider and re-fetch it."""
+        provider_type = self.provider_combo.currentText()
+        current_model = self.model_combo.currentText()
+        self._models_cache.pop(provider_type, None)
+        self.model_combo.set_provider_type(provider_type)
+        self.model_combo.setCurrentText(current_model)
+        self.model_combo.ensure_populated()
 
     def add_agent(self):
         """Add a new agent configuration."""
@@ -311,9 +508,8 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         # Save to database
         content_api.update_object(agent, proto_user_id=self._proto_user_id)
 
-        # Reload list and select new item
-        self.load_agents()
-        self.agent_list.setCurrentRow(self.agent_list.count() - 1)
+        # Append to the list and select the new item
+        self.agent_list.setCurrentIndex(self.agent_model.append_agent(agent))
 
     def remove_agent(self):
         """Remove the selected agent configuration."""
@@ -332,29 +528,34 @@ class AgentSettingsDialog(QtWidgets.QDialog):
                 cast(planning.ID, self._current_agent.obj_id),
                 proto_user_id=self._proto_user_id,
             )
+            row = self._agents.index(self._current_agent)
             self._current_agent = None
-            self.load_agents()
+            self.agent_model.remove_agent(row)
+            self.on_agent_selected()
 
     def save_current_agent(self) -> bool:
         """Save the current agent configuration."""
-        if not self._current_agent:
+        if not self._current_agent or not self._dirty:
             return True
 
+        name = self.name_edit.text().strip()
+        model = self.model_combo.currentText().strip()
+
         # Validate
-        if not self.name_edit.text().strip():
+        if not name:
             self.status_label.setText("Error: Name is required")
             self.status_label.setStyleSheet("color: red;")
             return False
 
-        if not self.model_combo.currentText().strip():
+        if not model:
             self.status_label.setText("Error: Model is required")
             self.status_label.setStyleSheet("color: red;")
             return False
 
         # Update agent from form
-        self._current_agent.name = self.name_edit.text().strip()
+        self._current_agent.name = name
         self._current_agent.provider_type = self.provider_combo.currentText()
-        self._current_agent.model = self.model_combo.currentText().strip()
+        self._current_agent.model = model
         self._current_agent.api_key = self.api_key_edit.text()
         self._current_agent.base_url = self.base_url_edit.text().strip()
         self._current_agent.temperature = self.temperature_spin.value()
@@ -362,46 +563,60 @@ class AgentSettingsDialog(QtWidgets.QDialog):
         self._current_agent.system_prompt = self.system_prompt_edit.toPlainText()
         self._current_agent.is_enabled = self.enabled_checkbox.isChecked()
 
-        # Handle default flag - ensure only one default
-        if self.default_checkbox.isChecked():
-            # Unset other defaults
-            for agent in self._agents:
-                if agent.obj_id != self._current_agent.obj_id and agent.is_default:
-                    agent.is_default = False
-                    content_api.update_object(agent, proto_user_id=self._proto_user_id)
-            self._current_agent.is_default = True
-        else:
-            self._current_agent.is_default = False
+        self._current_agent.is_default = self.default_checkbox.isChecked()
 
-        # Save to database
-        content_api.update_object(self._current_agent, proto_user_id=self._proto_user_id)
+        # Save the agent; making it default clears every other default with one UPDATE in the same transaction
+        content_api.update_agent(self._current_agent, proto_user_id=self._proto_user_id)
+        if self._current_agent.is_default:
+            # Mirror the cleared flags in memory rather than reloading from the database
+            current_id = self._current_agent.obj_id
+            for agent in [a for a in self._agents if a.is_default and a.obj_id != current_id]:
+                agent.is_default = False
+        self._dirty = False
 
         return True
 
     def test_connection(self):
         """Test connection to the configured provider."""
+        if self._test_throttle.isActive():
+            return
+        self._test_throttle.start()
+
         provider_type = self.provider_combo.currentText()
-        api_key = self.api_key_edit.text()
         base_url = self.base_url_edit.text()
         model = self.model_combo.currentText()
 
         # Resolve environment variable
-        if api_key.startswith("$"):
-            import os
-
-            env_var = api_key[1:]
-            api_key = os.environ.get(env_var, "")
-            if not api_key:
-                self.status_label.setText(f"Error: Environment variable {env_var} not set")
-                self.status_label.setStyleSheet("color: red;")
-                return
+        api_key, error = _resolve_api_key(self.api_key_edit.text())
+        if error:
+            self.status_label.setText(f"Error: {error}")
+            self.status_label.setStyleSheet("color: red;")
+            return
 
+        self.cancel_test_connection()
         self.status_label.setText("Testing connection...")
         self.status_label.setStyleSheet("color: gray;")
-        QtWidgets.QApplication.processEvents()
+        self.test_button.setEnabled(False)
+
+        worker = ConnectionTestWorker(provider_type, api_key, base_url, model)
+        worker.signals.finished.connect(self.on_test_finished)
+        self._test_signals = worker.signals
+        QtCore.QThreadPool.globalInstance().start(worker)
 
-        service = AICompletionService.instance()
-        success, message = service.test_connection(provider_type, api_key, base_url, model)
+    def cancel_test_connection(self):
+        """Ignore the result of any in-flight connection test; the network call itself is not interrupted."""
+        if self._test_signals is None:
+            return
+        self._test_signals = None
+        self.test_button.setEnabled(self._current_agent is not None)
+
+    @QtCore.Slot(bool, str)
+    def on_test_finished(self, success: bool, message: str):
+        """Show the result of a connection test."""
+        if self._test_signals is None or self.sender() is not self._test_signals:
+            return  # Result from a cancelled probe
+        self._test_signals = None
+        self.test_button.setEnabled(self._current_agent is not None)
 
         if success:
             self.status_label.setText(f"Success: {message}")
@@ -416,3 +631,8 @@ class AgentSettingsDialog(QtWidgets.QDialog):
             # Reload the AI service's default agent
             AICompletionService.instance().load_default_agent()
             self.accept()
+
+    def done(self, result: int):
+        """Drop any pending connection test before the dialog closes."""
+        self.cancel_test_connection()
+        super().done(result)
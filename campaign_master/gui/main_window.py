@@ -6,8 +6,9 @@ Provides navigation, menu system, and manages the overall application structure.
 
 import sys
 from pathlib import Path
-from typing import cast
+from typing import Callable, cast
 
+from pydantic import TypeAdapter
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from campaign_master.ai import AICompletionService
@@ -16,89 +17,278 @@ from campaign_master.content import executing, planning
 from campaign_master.gui.dialogs import AgentSettingsDialog
 from campaign_master.gui.widgets.executing import CampaignExecutionEdit
 from campaign_master.gui.widgets.planning import CampaignPlanEdit
+from campaign_master.util import get_basic_logger, write_bytes_atomic
+
+logger = get_basic_logger(__name__)
+
+WELCOME_SCREEN_QSS = """
+    QPushButton#WelcomeButton {
+        font-size: 16px;
+        font-weight: 600;
+    }
+    QLabel#ShortcutsHint {
+        color: #888888;
+        font-size: 12px;
+    }
+"""
+"""Stylesheet for the welcome screen, applied once to the screen rather than per widget."""
+
+
+_CAMPAIGN_ADAPTER = TypeAdapter(planning.CampaignPlan)
+"""Validates and serializes campaign plans as JSON bytes; built once at import."""
+
+# Menu shortcuts. Standard keys pick up the platform's own bindings; the rest are parsed once at import
+# rather than every time a window sets up its actions. Quit and SaveAs stay literal because Windows has
+# no standard binding for them.
+_NEW_CAMPAIGN_SHORTCUT = QtGui.QKeySequence.StandardKey.New
+_LOAD_CAMPAIGN_SHORTCUT = QtGui.QKeySequence.StandardKey.Open
+_IMPORT_CAMPAIGN_SHORTCUT = QtGui.QKeySequence("Ctrl+I")
+_SAVE_CAMPAIGN_SHORTCUT = QtGui.QKeySequence.StandardKey.Save
+_EXPORT_CAMPAIGN_SHORTCUT = QtGui.QKeySequence("Ctrl+Shift+S")
+_EXIT_SHORTCUT = QtGui.QKeySequence("Ctrl+Q")
+_CONFIGURE_AGENTS_SHORTCUT = QtGui.QKeySequence("Ctrl+Shift+A")
+_NEW_EXECUTION_SHORTCUT = QtGui.QKeySequence("Ctrl+Shift+N")
+_LOAD_EXECUTION_SHORTCUT = QtGui.QKeySequence("Ctrl+Shift+O")
+
+WELCOME_DESCRIPTION = "A companion application for TTRPG game masters,\nsupporting campaign planning and execution."
+"""Tagline shown under the welcome screen title."""
+
+ABOUT_TEXT = (
+    "Campaign Master\n\n"
+    "A companion application for TTRPG game masters.\n\n"
+    "Supports campaign planning and execution in both\n"
+    "GUI and web modes."
+)
+"""Body of the Help > About dialog."""
+
+IMPORT_FILE_FILTER = "JSON Files (*.json);;All Files (*)"
+"""File dialog filter for importing campaigns."""
+
+EXPORT_FILE_FILTER = "JSON Files (*.json)"
+"""File dialog filter for exporting campaigns."""
+
+LARGE_IMPORT_FILE_SIZE = 50 * 1024 * 1024
+"""Campaign JSON size, in bytes, above which import asks for confirmation before reading it into memory."""
+
+SUMMARY_PREVIEW_LENGTH = 100
+"""Number of summary characters shown under each campaign in the Load dialog."""
+
+
+def _shortcut_text(shortcut: QtGui.QKeySequence | QtGui.QKeySequence.StandardKey) -> str:
+    """Render a shortcut the way the platform shows it in menus (e.g. Ctrl+N, or ⌘N on macOS)."""
+    return QtGui.QKeySequence(shortcut).toString(QtGui.QKeySequence.SequenceFormat.NativeText)
+
+
+def _summary_preview(summary: str) -> str:
+    """Truncate a summary for display, marking the cut with an ellipsis."""
+    if len(summary) <= SUMMARY_PREVIEW_LENGTH:
+        return summary
+    return summary[:SUMMARY_PREVIEW_LENGTH] + "..."
+
+
+def _read_campaign_file(file_path: str) -> planning.CampaignPlan:
+    """Read and validate a campaign JSON file."""
+    # Hand pydantic the raw bytes; it decodes UTF-8 itself while parsing
+    return _CAMPAIGN_ADAPTER.validate_json(Path(file_path).read_bytes())
+
+
+class CampaignListModel(QtCore.QAbstractListModel):
+    """List model over (obj_id, title, summary) campaign rows, formatted only when the view asks."""
+
+    def __init__(self, rows: list[tuple[planning.ID, str, str]], parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        # Qt asks for a row's text on every size hint and repaint; format each row once
+        self._display_text: dict[planning.ID, str] = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        obj_id, title, summary = self._rows[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            text = self._display_text.get(obj_id)
+            if text is None:
+                text = f"{title or 'Untitled Campaign'} (ID: {obj_id})"
+                if summary:
+                    text += "\n  " + _summary_preview(summary)
+                self._display_text[obj_id] = text
+            return text
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return obj_id, title
+        return None
+
+    def set_rows(self, rows: list[tuple[planning.ID, str, str]]):
+        """Replace every row with a fresh set of campaigns."""
+        self.beginResetModel()
+        self._rows = rows
+        self._display_text.clear()
+        self.endResetModel()
+
+    def remove_row(self, row: int):
+        """Remove the campaign at the given row."""
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        obj_id, _, _ = self._rows.pop(row)
+        self._display_text.pop(obj_id, None)
+        self.endRemoveRows()
+
+
+class ExecutionListModel(QtCore.QAbstractListModel):
+    """List model over (obj_id, title, session_date) execution rows, formatted only when the view asks."""
+
+    def __init__(self, rows: list[tuple[planning.ID, str, str]], parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._display_text: dict[planning.ID, str] = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        obj_id, title, session_date = self._rows[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            text = self._display_text.get(obj_id)
+            if text is None:
+                text = f"{title or 'Untitled Session'} (ID: {obj_id})"
+                if session_date:
+                    text += f" - {session_date}"
+                self._display_text[obj_id] = text
+            return text
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return obj_id
+        return None
+
+    def set_rows(self, rows: list[tuple[planning.ID, str, str]]):
+        """Replace every row with a fresh set of executions."""
+        self.beginResetModel()
+        self._rows = rows
+        self._display_text.clear()
+        self.endResetModel()
+
+
+class _BackgroundTaskSignals(QtCore.QObject):
+    """Signals emitted by BackgroundTaskWorker (QRunnable cannot emit signals itself)."""
+
+    finished = QtCore.Signal(object)  # task result
+    failed = QtCore.Signal(str)  # error message
+
+
+class BackgroundTaskWorker(QtCore.QRunnable):
+    """Runs a blocking database or file call on a QThreadPool thread."""
+
+    def __init__(self, task: Callable[[], object]):
+        super().__init__()
+        self.signals = _BackgroundTaskSignals()
+        self._task = task
+
+    def run(self):
+        """Execute the task and report its result."""
+        try:
+            result = self._task()
+        except Exception as e:
+            logger.error("Background task error: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
 
 
 class CampaignMasterWindow(QtWidgets.QMainWindow):
     """Main application window with menu bar and navigation."""
 
+    _title_font: QtGui.QFont | None = None
+    """Welcome screen title font, shared by every window once built."""
+
+    _icon: QtGui.QIcon | None = None
+    """Window/taskbar icon, decoded once; a null icon if the asset is missing."""
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Campaign Master")
         self.setGeometry(100, 100, 1024, 768)
 
         # Set window/taskbar icon
-        if getattr(sys, "frozen", False):
-            base_path = Path(sys._MEIPASS)
-        else:
-            base_path = Path(__file__).resolve().parent.parent
-        icon_path = base_path / "assets" / "images" / "icons" / "book2.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QtGui.QIcon(str(icon_path)))
+        icon = self._window_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
         # Central widget - stacked widget for switching views
         self.central_widget = QtWidgets.QStackedWidget()
         self.setCentralWidget(self.central_widget)
 
         # Track current editor
-        self.current_editor = None
+        self.current_editor: CampaignPlanEdit | CampaignExecutionEdit | None = None
+
+        # Signals of database and file tasks in flight, kept alive until their result is delivered.
+        # The pool deletes each worker after it runs; only its signals object must outlive it.
+        self._pending_tasks: set[_BackgroundTaskSignals] = set()
+        self._load_progress: QtWidgets.QProgressDialog | None = None
+        self._load_dialog: QtWidgets.QDialog | None = None
+        self._load_execution_dialog: QtWidgets.QDialog | None = None
+
+        # (id, name, default) per enabled agent as last shown in the Default Agent submenu
+        self._agents_signature: tuple | None = None
+
+        # Built on first show, and only if no editor has been opened by then
+        self.welcome_screen: QtWidgets.QWidget | None = None
 
         # Setup UI components
         self.setup_actions()
         self.setup_menu_bar()
-        self.setup_welcome_screen()
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        if self.welcome_screen is None and self.current_editor is None:
+            self.setup_welcome_screen()
+        super().showEvent(event)
+
+    def _make_action(
+        self,
+        text: str,
+        slot: Callable,
+        shortcut: QtGui.QKeySequence | QtGui.QKeySequence.StandardKey | None = None,
+    ) -> QtGui.QAction:
+        """Create a window action connected directly to its GUI-thread handler."""
+        action = QtGui.QAction(text, self)
+        if isinstance(shortcut, QtGui.QKeySequence.StandardKey):
+            action.setShortcuts(shortcut)
+        elif shortcut is not None:
+            action.setShortcut(shortcut)
+        action.triggered.connect(slot, QtCore.Qt.ConnectionType.DirectConnection)
+        return action
 
     def setup_actions(self):
         """Create actions for the menu."""
-        # New campaign action
-        self.new_action = QtGui.QAction("&New Campaign", self)
-        self.new_action.setShortcut("Ctrl+N")
-        self.new_action.triggered.connect(self.new_campaign)
-
-        # Load campaign from database action
-        self.load_action = QtGui.QAction("&Load Campaign from Database", self)
-        self.load_action.setShortcut("Ctrl+O")
-        self.load_action.triggered.connect(self.load_campaign)
-
-        # Import campaign from JSON action
-        self.import_action = QtGui.QAction("&Import Campaign from JSON...", self)
-        self.import_action.setShortcut("Ctrl+I")
-        self.import_action.triggered.connect(self.import_campaign)
-
-        # Save to database action
-        self.save_action = QtGui.QAction("&Save to Database", self)
-        self.save_action.setShortcut("Ctrl+S")
-        self.save_action.triggered.connect(self.save_campaign)
+        # Campaign actions
+        self.new_action = self._make_action("&New Campaign", self.new_campaign, _NEW_CAMPAIGN_SHORTCUT)
+        self.load_action = self._make_action(
+            "&Load Campaign from Database", self.load_campaign, _LOAD_CAMPAIGN_SHORTCUT
+        )
+        self.import_action = self._make_action(
+            "&Import Campaign from JSON...", self.import_campaign, _IMPORT_CAMPAIGN_SHORTCUT
+        )
+        self.save_action = self._make_action("&Save to Database", self.save_campaign, _SAVE_CAMPAIGN_SHORTCUT)
         self.save_action.setEnabled(False)  # Disabled until campaign opened
-
-        # Export to JSON action
-        self.export_action = QtGui.QAction("&Export to JSON...", self)
-        self.export_action.setShortcut("Ctrl+Shift+S")
-        self.export_action.triggered.connect(self.export_campaign)
+        self.export_action = self._make_action("&Export to JSON...", self.export_campaign, _EXPORT_CAMPAIGN_SHORTCUT)
         self.export_action.setEnabled(False)  # Disabled until campaign opened
-
-        # Exit action
-        self.exit_action = QtGui.QAction("E&xit", self)
-        self.exit_action.setShortcut("Ctrl+Q")
-        self.exit_action.triggered.connect(self.close)
+        self.exit_action = self._make_action("E&xit", self.close, _EXIT_SHORTCUT)
 
         # Agent actions
-        self.configure_agents_action = QtGui.QAction("&Configure Agents...", self)
-        self.configure_agents_action.setShortcut("Ctrl+Shift+A")
-        self.configure_agents_action.triggered.connect(self.show_agent_settings)
+        self.configure_agents_action = self._make_action(
+            "&Configure Agents...", self.show_agent_settings, _CONFIGURE_AGENTS_SHORTCUT
+        )
 
         # Execution actions
-        self.new_execution_action = QtGui.QAction("New E&xecution", self)
-        self.new_execution_action.setShortcut("Ctrl+Shift+N")
-        self.new_execution_action.triggered.connect(self.new_execution)
-
-        self.load_execution_action = QtGui.QAction("Load Execution from &Database", self)
-        self.load_execution_action.setShortcut("Ctrl+Shift+O")
-        self.load_execution_action.triggered.connect(self.load_execution)
+        self.new_execution_action = self._make_action("New E&xecution", self.new_execution, _NEW_EXECUTION_SHORTCUT)
+        self.load_execution_action = self._make_action(
+            "Load Execution from &Database", self.load_execution, _LOAD_EXECUTION_SHORTCUT
+        )
 
-        self.enable_ai_action = QtGui.QAction("&Enable AI Completions", self)
+        self.enable_ai_action = self._make_action("&Enable AI Completions", self.toggle_ai_completions)
         self.enable_ai_action.setCheckable(True)
         self.enable_ai_action.setChecked(True)
-        self.enable_ai_action.triggered.connect(self.toggle_ai_completions)
 
     def setup_menu_bar(self):
         """Create menu bar with File, Edit, Help menus."""
@@ -106,12 +296,9 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # File menu
         file_menu = menubar.addMenu("&File")
-        file_menu.addAction(self.new_action)
-        file_menu.addAction(self.load_action)
-        file_menu.addAction(self.import_action)
+        file_menu.addActions([self.new_action, self.load_action, self.import_action])
         file_menu.addSeparator()
-        file_menu.addAction(self.save_action)
-        file_menu.addAction(self.export_action)
+        file_menu.addActions([self.save_action, self.export_action])
 
         file_menu.addSeparator()
 
@@ -119,8 +306,7 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # Execution menu
         execution_menu = menubar.addMenu("E&xecution")
-        execution_menu.addAction(self.new_execution_action)
-        execution_menu.addAction(self.load_execution_action)
+        execution_menu.addActions([self.new_execution_action, self.load_execution_action])
 
         # Edit menu
         edit_menu = menubar.addMenu("&Edit")
@@ -133,6 +319,11 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # Default agent submenu (populated dynamically)
         self.default_agent_menu = agents_menu.addMenu("Set &Default Agent")
+        self._agent_action_group = QtGui.QActionGroup(self)
+        self._agent_action_group.setExclusive(True)
+        self._agent_action_group.triggered.connect(
+            self._on_default_agent_triggered, QtCore.Qt.ConnectionType.DirectConnection
+        )
         self.update_default_agent_menu()
 
         agents_menu.addSeparator()
@@ -140,9 +331,36 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # Help menu
         help_menu = menubar.addMenu("&Help")
-        about_action = QtGui.QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        help_menu.addAction(self._make_action("&About", self.show_about))
+
+    @classmethod
+    def _window_icon(cls) -> QtGui.QIcon:
+        """Locate and load the application icon on first use and reuse it afterwards."""
+        if cls._icon is None:
+            if getattr(sys, "frozen", False):
+                base_path = Path(sys._MEIPASS)
+            else:
+                base_path = Path(__file__).resolve().parent.parent
+            icon_path = base_path / "assets" / "images" / "icons" / "book2.ico"
+            cls._icon = QtGui.QIcon(str(icon_path)) if icon_path.exists() else QtGui.QIcon()
+        return cls._icon
+
+    @classmethod
+    def _welcome_title_font(cls) -> QtGui.QFont:
+        """Build the welcome title font on first use and reuse it afterwards."""
+        if cls._title_font is None:
+            # Resolve family, size and weight in one constructor call
+            cls._title_font = QtGui.QFont(QtGui.QGuiApplication.font().family(), 24, QtGui.QFont.Weight.Bold)
+        return cls._title_font
+
+    def _make_welcome_button(self, text: str, slot: Callable) -> QtWidgets.QPushButton:
+        """Create one of the welcome screen's large action buttons, styled by WELCOME_SCREEN_QSS."""
+        button = QtWidgets.QPushButton(text)
+        button.setMinimumWidth(200)
+        button.setMinimumHeight(40)
+        button.setObjectName("WelcomeButton")
+        button.clicked.connect(slot, QtCore.Qt.ConnectionType.DirectConnection)
+        return button
 
     def setup_welcome_screen(self):
         """Create welcome/landing screen."""
@@ -151,59 +369,28 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # Title
         title_label = QtWidgets.QLabel("Welcome to Campaign Master!")
-        title_font = QtGui.QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self._welcome_title_font())
         title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
 
         layout.addSpacing(40)
 
         # Description
-        desc_label = QtWidgets.QLabel(
-            "A companion application for TTRPG game masters,\n" "supporting campaign planning and execution."
-        )
+        desc_label = QtWidgets.QLabel(WELCOME_DESCRIPTION)
         desc_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(desc_label)
 
         layout.addSpacing(40)
 
         # Buttons
-        welcome_btn_style = """
-            QPushButton {
-                font-size: 16px;
-                font-weight: 600;
-            }
-        """
-
         button_layout = QtWidgets.QHBoxLayout()
         button_layout.addStretch()
 
-        new_btn = QtWidgets.QPushButton("Create New Campaign")
-        new_btn.setMinimumWidth(200)
-        new_btn.setMinimumHeight(40)
-        new_btn.setStyleSheet(welcome_btn_style)
-        new_btn.clicked.connect(self.new_campaign)
-        button_layout.addWidget(new_btn)
-
+        button_layout.addWidget(self._make_welcome_button("Create New Campaign", self.new_campaign))
         button_layout.addSpacing(20)
-
-        load_btn = QtWidgets.QPushButton("Load from Database")
-        load_btn.setMinimumWidth(200)
-        load_btn.setMinimumHeight(40)
-        load_btn.setStyleSheet(welcome_btn_style)
-        load_btn.clicked.connect(self.load_campaign)
-        button_layout.addWidget(load_btn)
-
+        button_layout.addWidget(self._make_welcome_button("Load from Database", self.load_campaign))
         button_layout.addSpacing(20)
-
-        import_btn = QtWidgets.QPushButton("Import from JSON")
-        import_btn.setMinimumWidth(200)
-        import_btn.setMinimumHeight(40)
-        import_btn.setStyleSheet(welcome_btn_style)
-        import_btn.clicked.connect(self.import_campaign)
-        button_layout.addWidget(import_btn)
+        button_layout.addWidget(self._make_welcome_button("Import from JSON", self.import_campaign))
 
         button_layout.addStretch()
         layout.addLayout(button_layout)
@@ -212,60 +399,267 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         # Keyboard shortcuts hint
         shortcuts_label = QtWidgets.QLabel(
-            "Ctrl+N  New Campaign  |  Ctrl+O  Load from Database  |  " "Ctrl+I  Import from JSON"
+            f"{_shortcut_text(_NEW_CAMPAIGN_SHORTCUT)}  New Campaign  |  "
+            f"{_shortcut_text(_LOAD_CAMPAIGN_SHORTCUT)}  Load from Database  |  "
+            f"{_shortcut_text(_IMPORT_CAMPAIGN_SHORTCUT)}  Import from JSON"
         )
         shortcuts_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        shortcuts_label.setStyleSheet("color: #888888; font-size: 12px;")
+        shortcuts_label.setObjectName("ShortcutsHint")
         layout.addWidget(shortcuts_label)
 
         layout.addStretch()
 
         welcome.setLayout(layout)
+        welcome.setStyleSheet(WELCOME_SCREEN_QSS)
         self.central_widget.addWidget(welcome)
         self.welcome_screen = welcome
 
+    def _install_editor(self, editor: CampaignPlanEdit | CampaignExecutionEdit):
+        """Make editor the current view, disposing of the editor it replaces, and update Save/Export."""
+        # Suspend repaints so the swap is laid out and painted once
+        self.central_widget.setUpdatesEnabled(False)
+        try:
+            if self.current_editor is not None:
+                self.central_widget.removeWidget(self.current_editor)
+                self.current_editor.deleteLater()
+            self.central_widget.addWidget(editor)
+            self.central_widget.setCurrentWidget(editor)
+            self.current_editor = editor
+        finally:
+            self.central_widget.setUpdatesEnabled(True)
+
+        # Any editor can be saved; only campaign plans export to JSON
+        self.save_action.setEnabled(True)
+        self.export_action.setEnabled(isinstance(editor, CampaignPlanEdit))
+
+    def _open_campaign_editor(self, campaign: planning.CampaignPlan | None = None):
+        """Build a campaign plan editor and make it the current view."""
+        self._install_editor(CampaignPlanEdit(campaign))
+
+    @QtCore.Slot()
     def new_campaign(self):
         """Create new campaign plan."""
-        editor = CampaignPlanEdit()
-        self.central_widget.addWidget(editor)
-        self.central_widget.setCurrentWidget(editor)
-        self.current_editor = editor
-
-        # Enable save/export actions
-        self.save_action.setEnabled(True)
-        self.export_action.setEnabled(True)
+        # Build the editor on the next event loop pass, so the menu or button repaints first
+        QtCore.QTimer.singleShot(0, self._open_campaign_editor)
 
+    @QtCore.Slot()
     def import_campaign(self):
         """Import campaign from JSON file."""
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import Campaign", "", "JSON Files (*.json);;All Files (*)"
-        )
+        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import Campaign", "", IMPORT_FILE_FILTER)
         if file_path:
+            if not self._confirm_large_import(file_path):
+                return
+            # Read and parse off the GUI thread
+            self._run_background_task(
+                lambda: _read_campaign_file(file_path),
+                self.on_campaign_imported,
+                self.on_campaign_import_failed,
+            )
+
+    def _confirm_large_import(self, file_path: str) -> bool:
+        """Ask before importing a file large enough to take a while and a lot of memory to parse."""
+        try:
+            size = Path(file_path).stat().st_size
+        except OSError:
+            return True  # Let the import itself report the unreadable file
+        if size <= LARGE_IMPORT_FILE_SIZE:
+            return True
+        reply = QtWidgets.QMessageBox.question(
+            self,
+            "Large Campaign File",
+            f"This file is {size / (1024 * 1024):.1f} MB and may take a while to import.\n\nImport it anyway?",
+            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+            QtWidgets.QMessageBox.StandardButton.No,
+        )
+        return reply == QtWidgets.QMessageBox.StandardButton.Yes
+
+    @QtCore.Slot(object)
+    def on_campaign_imported(self, campaign: planning.CampaignPlan):
+        """Open an imported campaign in a new editor."""
+        self._open_campaign_editor(campaign)
+
+    @QtCore.Slot(str)
+    def on_campaign_import_failed(self, message: str):
+        """Report a campaign file that could not be read or parsed."""
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Importing Campaign",
+            f"Failed to import campaign:\n{message}",
+        )
+
+    def _run_background_task(
+        self,
+        task: Callable[[], object],
+        on_finished: Callable[[object], None],
+        on_failed: Callable[[str], None],
+    ):
+        """Run a blocking database or file call on the thread pool and deliver its outcome on the GUI thread."""
+        worker = BackgroundTaskWorker(task)
+        signals = worker.signals
+        signals.finished.connect(on_finished)
+        signals.failed.connect(on_failed)
+        # A bound slot rather than a lambda, so nothing but the pool references the worker
+        signals.finished.connect(self._on_background_task_done)
+        signals.failed.connect(self._on_background_task_done)
+        self._pending_tasks.add(signals)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    @QtCore.Slot()
+    def _on_background_task_done(self):
+        """Release the signals of a task whose result has been delivered."""
+        self._pending_tasks.discard(self.sender())
+
+    @QtCore.Slot()
+    def load_campaign(self):
+        """Load campaign from database."""
+        if not self._begin_load("Loading campaigns...", "Load Campaign from Database"):
+            return
+        self._run_background_task(
+            lambda: content_api.retrieve_campaign_summaries(proto_user_id=0),
+            self.on_campaigns_loaded,
+            self.on_campaigns_load_failed,
+        )
+
+    def _begin_load(self, label: str, title: str) -> bool:
+        """Show the busy dialog for a database load; returns False if a load is already in flight."""
+        if self._load_progress is not None:
+            return False
+        self.load_action.setEnabled(False)
+        self.load_execution_action.setEnabled(False)
+        progress = QtWidgets.QProgressDialog(label, None, 0, 0, self)
+        progress.setWindowTitle(title)
+        progress.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        progress.setValue(0)  # Starts the minimum-duration timer, so fast loads never show it
+        self._load_progress = progress
+        return True
+
+    def _finish_load(self):
+        """Dismiss the load progress dialog."""
+        if self._load_progress is not None:
+            self._load_progress.close()
+            self._load_progress.deleteLater()
+            self._load_progress = None
+        self.load_action.setEnabled(True)
+        self.load_execution_action.setEnabled(True)
+
+    @QtCore.Slot(str)
+    def on_campaigns_load_failed(self, message: str):
+        """Report a failed campaign retrieval."""
+        self._finish_load()
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Loading Campaign",
+            f"Failed to load campaigns from database:\n{message}",
+        )
+
+    def _build_load_dialog(self) -> QtWidgets.QDialog:
+        """Create the Load Campaign dialog; its rows are filled in by on_campaigns_loaded."""
+        # Create dialog to select campaign
+        dialog = QtWidgets.QDialog(self)
+        dialog.setWindowTitle("Load Campaign from Database")
+        dialog.setMinimumWidth(500)
+        dialog.setMinimumHeight(400)
+
+        layout = QtWidgets.QVBoxLayout()
+
+        # Instructions
+        label = QtWidgets.QLabel("Select a campaign to load:")
+        layout.addWidget(label)
+
+        # Campaign list; rows are only formatted when the view paints them
+        campaign_model = CampaignListModel([], dialog)
+        list_view = QtWidgets.QListView()
+        list_view.setModel(campaign_model)
+        list_view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        layout.addWidget(list_view)
+
+        # Buttons
+        button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel
+        )
+        delete_button = QtWidgets.QPushButton("Delete")
+        button_box.addButton(delete_button, QtWidgets.QDialogButtonBox.ButtonRole.ActionRole)
+        ok_button = button_box.button(QtWidgets.QDialogButtonBox.StandardButton.Ok)
+
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        delete_button.clicked.connect(self._on_delete_selected_campaign)
+        list_view.selectionModel().selectionChanged.connect(self._on_campaign_selection_changed)
+
+        layout.addWidget(button_box)
+
+        dialog.setLayout(layout)
+
+        self._campaign_model = campaign_model
+        self._campaign_list_view = list_view
+        self._campaign_delete_button = delete_button
+        self._campaign_ok_button = ok_button
+        return dialog
+
+    @QtCore.Slot()
+    def _on_delete_selected_campaign(self):
+        """Delete the campaigns selected in the Load dialog."""
+        dialog = cast(QtWidgets.QDialog, self._load_dialog)
+        rows = sorted(index.row() for index in self._campaign_list_view.selectionModel().selectedRows())
+        if not rows:
+            return
+
+        selected = [self._campaign_model.index(row).data(QtCore.Qt.ItemDataRole.UserRole) for row in rows]
+        if len(selected) == 1:
+            target = f"'{selected[0][1] or 'Untitled Campaign'}'"
+        else:
+            target = f"these {len(selected)} campaigns"
+
+        # Confirmation dialog
+        reply = QtWidgets.QMessageBox.question(
+            dialog,
+            "Confirm Deletion",
+            f"Are you sure you want to delete {target}?\n\n" "This action cannot be undone.",
+            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+            QtWidgets.QMessageBox.StandardButton.No,
+        )
+
+        if reply == QtWidgets.QMessageBox.StandardButton.Yes:
             try:
-                with open(file_path, "r") as f:
-                    campaign = planning.CampaignPlan.model_validate_json(f.read())
-                editor = CampaignPlanEdit(campaign)
-                self.central_widget.addWidget(editor)
-                self.central_widget.setCurrentWidget(editor)
-                self.current_editor = editor
-
-                # Enable save/export actions
-                self.save_action.setEnabled(True)
-                self.export_action.setEnabled(True)
+                # Delete from database in one transaction
+                content_api.delete_objects([obj_id for obj_id, _ in selected], proto_user_id=0)
+
+                # Remove from list, bottom-up so earlier rows keep their positions
+                self._campaign_list_view.setUpdatesEnabled(False)
+                try:
+                    for row in reversed(rows):
+                        self._campaign_model.remove_row(row)
+                finally:
+                    self._campaign_list_view.setUpdatesEnabled(True)
+
+                # Check if list is empty
+                if self._campaign_model.rowCount() == 0:
+                    QtWidgets.QMessageBox.information(
+                        dialog,
+                        "No Campaigns",
+                        "No campaigns found in the database.",
+                    )
+                    dialog.reject()
+
             except Exception as e:
                 QtWidgets.QMessageBox.critical(
-                    self,
-                    "Error Importing Campaign",
-                    f"Failed to import campaign:\n{str(e)}",
+                    dialog,
+                    "Delete Failed",
+                    f"Failed to delete campaign: {str(e)}",
                 )
 
-    def load_campaign(self):
-        """Load campaign from database."""
+    @QtCore.Slot()
+    def _on_campaign_selection_changed(self):
+        """Enable Delete while any campaign is selected, and OK only while exactly one is."""
+        selected = len(self._campaign_list_view.selectionModel().selectedRows())
+        self._campaign_delete_button.setEnabled(selected > 0)
+        self._campaign_ok_button.setEnabled(selected == 1)
+
+    @QtCore.Slot(object)
+    def on_campaigns_loaded(self, campaigns: list[tuple[planning.ID, str, str]]):
+        """Let the user pick one of the retrieved (obj_id, title, summary) campaigns to open."""
+        self._finish_load()
         try:
-            # Retrieve all campaigns from database
-            campaigns = content_api.retrieve_objects(planning.CampaignPlan, proto_user_id=0)
-            campaigns = cast(list[planning.CampaignPlan], campaigns)
-
             if not campaigns:
                 QtWidgets.QMessageBox.information(
                     self,
@@ -274,106 +668,28 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
                 )
                 return
 
-            # Create dialog to select campaign
-            dialog = QtWidgets.QDialog(self)
-            dialog.setWindowTitle("Load Campaign from Database")
-            dialog.setMinimumWidth(500)
-            dialog.setMinimumHeight(400)
-
-            layout = QtWidgets.QVBoxLayout()
-
-            # Instructions
-            label = QtWidgets.QLabel("Select a campaign to load:")
-            layout.addWidget(label)
-
-            # Campaign list
-            list_widget = QtWidgets.QListWidget()
-            for campaign in campaigns:
-                item_text = f"{campaign.title or 'Untitled Campaign'} (ID: {campaign.obj_id})"
-                if campaign.summary:
-                    item_text += f"\n  {campaign.summary[:100]}{'...' if len(campaign.summary) > 100 else ''}"
-                item = QtWidgets.QListWidgetItem(item_text)
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, campaign)
-                list_widget.addItem(item)
-
-            list_widget.setCurrentRow(0)
-            layout.addWidget(list_widget)
-
-            # Delete handler function
-            def delete_selected_campaign():
-                current_item = list_widget.currentItem()
-                if not current_item:
-                    return
-
-                campaign = current_item.data(QtCore.Qt.ItemDataRole.UserRole)
-
-                # Confirmation dialog
-                reply = QtWidgets.QMessageBox.question(
-                    dialog,
-                    "Confirm Deletion",
-                    f"Are you sure you want to delete '{campaign.title or 'Untitled Campaign'}'?\n\n"
-                    "This action cannot be undone.",
-                    QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-                    QtWidgets.QMessageBox.StandardButton.No,
-                )
-
-                if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                    try:
-                        # Delete from database
-                        content_api.delete_object(campaign.obj_id, proto_user_id=0)
-
-                        # Remove from list
-                        list_widget.takeItem(list_widget.row(current_item))
-
-                        # Check if list is empty
-                        if list_widget.count() == 0:
-                            QtWidgets.QMessageBox.information(
-                                dialog,
-                                "No Campaigns",
-                                "No campaigns found in the database.",
-                            )
-                            dialog.reject()
-
-                    except Exception as e:
-                        QtWidgets.QMessageBox.critical(
-                            dialog,
-                            "Delete Failed",
-                            f"Failed to delete campaign: {str(e)}",
-                        )
-
-            # Update delete button state based on selection
-            def update_delete_button():
-                delete_button.setEnabled(list_widget.currentItem() is not None)
-
-            # Buttons
-            button_box = QtWidgets.QDialogButtonBox(
-                QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel
-            )
-            delete_button = QtWidgets.QPushButton("Delete")
-            button_box.addButton(delete_button, QtWidgets.QDialogButtonBox.ButtonRole.ActionRole)
-
-            button_box.accepted.connect(dialog.accept)
-            button_box.rejected.connect(dialog.reject)
-            delete_button.clicked.connect(delete_selected_campaign)
-            list_widget.itemSelectionChanged.connect(update_delete_button)
-
-            layout.addWidget(button_box)
-
-            dialog.setLayout(layout)
+            # The dialog is built once and refilled on each load
+            if self._load_dialog is None:
+                self._load_dialog = self._build_load_dialog()
+            dialog = self._load_dialog
+            list_view = self._campaign_list_view
+            # The model reset clears the selection silently, so selecting the first row
+            # is the one selectionChanged that enables Delete and OK
+            self._campaign_model.set_rows(campaigns)
+            list_view.setCurrentIndex(self._campaign_model.index(0))
 
             # Show dialog and get result
             if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-                current_item = list_widget.currentItem()
-                if current_item:
-                    campaign = current_item.data(QtCore.Qt.ItemDataRole.UserRole)
-                    editor = CampaignPlanEdit(campaign)
-                    self.central_widget.addWidget(editor)
-                    self.central_widget.setCurrentWidget(editor)
-                    self.current_editor = editor
-
-                    # Enable save/export actions
-                    self.save_action.setEnabled(True)
-                    self.export_action.setEnabled(True)
+                # Open the selected campaign, not the current row, which may be unselected
+                selected = list_view.selectionModel().selectedRows()
+                if len(selected) == 1:
+                    obj_id, _ = selected[0].data(QtCore.Qt.ItemDataRole.UserRole)
+                    # Only the picked campaign is loaded in full
+                    self._run_background_task(
+                        lambda: content_api.retrieve_object(obj_id, proto_user_id=0),
+                        self.on_campaign_retrieved,
+                        self.on_campaigns_load_failed,
+                    )
 
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -382,9 +698,18 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
                 f"Failed to load campaigns from database:\n{str(e)}",
             )
 
+    @QtCore.Slot(object)
+    def on_campaign_retrieved(self, campaign: planning.CampaignPlan | None):
+        """Open the campaign picked in the Load dialog."""
+        if campaign is None:
+            QtWidgets.QMessageBox.warning(self, "Campaign Not Found", "The selected campaign no longer exists.")
+            return
+        self._open_campaign_editor(campaign)
+
+    @QtCore.Slot()
     def save_campaign(self):
         """Save current campaign to database."""
-        if not hasattr(self, "current_editor") or self.current_editor is None:
+        if self.current_editor is None:
             QtWidgets.QMessageBox.warning(self, "No Campaign", "No campaign is currently open.")
             return
 
@@ -396,69 +721,154 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
         try:
             # Export campaign data from editor
             campaign = self.current_editor.export_content()
+        except Exception as e:
+            self.on_campaign_save_failed(str(e))
+            return
 
-            # Save to database (proto_user_id=0 for GUI mode)
-            if self.current_editor.campaign_plan is not None:
-                content_api.update_object(campaign, proto_user_id=0)
-                message = "Campaign saved to database successfully."
-            else:
-                content_api._create_object(campaign, proto_user_id=0)
-                message = "Campaign created in database successfully."
-                self.current_editor.campaign_plan = campaign
+        # Save to database (proto_user_id=0 for GUI mode) off the GUI thread
+        editor = self.current_editor
+        is_new = editor.campaign_plan is None
 
-            QtWidgets.QMessageBox.information(self, "Save Successful", message)
+        def save() -> planning.CampaignPlan:
+            if is_new:
+                content_api._create_object(campaign, proto_user_id=0)
+            else:
+                content_api.update_object(campaign, proto_user_id=0)
+            return campaign
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Error Saving Campaign",
-                f"Failed to save campaign to database:\n{str(e)}",
+        def on_saved(saved: object):
+            if is_new:
+                editor.campaign_plan = cast(planning.CampaignPlan, saved)
+            self.on_campaign_saved(
+                "Campaign created in database successfully." if is_new else "Campaign saved to database successfully."
             )
 
+        self.save_action.setEnabled(False)
+        self._run_background_task(save, on_saved, self.on_campaign_save_failed)
+
+    @QtCore.Slot(str)
+    def on_campaign_saved(self, message: str):
+        """Report a completed campaign save."""
+        self.save_action.setEnabled(True)
+        QtWidgets.QMessageBox.information(self, "Save Successful", message)
+
+    @QtCore.Slot(str)
+    def on_campaign_save_failed(self, message: str):
+        """Report a failed campaign save."""
+        self.save_action.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Saving Campaign",
+            f"Failed to save campaign to database:\n{message}",
+        )
+
+    @QtCore.Slot()
     def export_campaign(self):
         """Export current campaign to JSON file."""
-        if not hasattr(self, "current_editor") or self.current_editor is None:
+        if not isinstance(self.current_editor, CampaignPlanEdit):
             QtWidgets.QMessageBox.warning(self, "No Campaign", "No campaign is currently open.")
             return
 
-        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Campaign", "", "JSON Files (*.json)")
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Campaign", "", EXPORT_FILE_FILTER)
 
         if file_path:
-            try:
-                # Ensure .json extension
-                if not file_path.endswith(".json"):
-                    file_path += ".json"
+            # Ensure .json extension
+            if not file_path.endswith(".json"):
+                file_path += ".json"
 
-                # Export campaign data from editor
+            try:
+                # Export campaign data from editor (widgets must be read on the GUI thread)
                 campaign = self.current_editor.export_content()
+            except Exception as e:
+                self.on_campaign_export_failed(str(e))
+                return
 
-                # Write to JSON file
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(campaign.model_dump_json(indent=2))
+            def export() -> str:
+                # Serialize straight to UTF-8 bytes and swap the file in atomically. Fields left at
+                # their defaults are omitted; import fills them back in from the model.
+                write_bytes_atomic(file_path, _CAMPAIGN_ADAPTER.dump_json(campaign, indent=2, exclude_defaults=True))
+                return file_path
 
-                QtWidgets.QMessageBox.information(self, "Export Successful", f"Campaign exported to:\n{file_path}")
+            self.export_action.setEnabled(False)
+            self._run_background_task(export, self.on_campaign_exported, self.on_campaign_export_failed)
 
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self,
-                    "Error Exporting Campaign",
-                    f"Failed to export campaign:\n{str(e)}",
-                )
+    @QtCore.Slot(object)
+    def on_campaign_exported(self, file_path: str):
+        """Report a completed campaign export."""
+        self.export_action.setEnabled(True)
+        QtWidgets.QMessageBox.information(self, "Export Successful", f"Campaign exported to:\n{file_path}")
 
+    @QtCore.Slot(str)
+    def on_campaign_export_failed(self, message: str):
+        """Report a failed campaign export."""
+        self.export_action.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Exporting Campaign",
+            f"Failed to export campaign:\n{message}",
+        )
+
+    @QtCore.Slot()
     def new_execution(self):
         """Create a new campaign execution."""
-        editor = CampaignExecutionEdit()
-        self.central_widget.addWidget(editor)
-        self.central_widget.setCurrentWidget(editor)
-        self.current_editor = editor
-        self.save_action.setEnabled(True)
+        self._install_editor(CampaignExecutionEdit())
 
+    @QtCore.Slot()
     def load_execution(self):
         """Load a campaign execution from database."""
-        try:
-            executions = content_api.retrieve_objects(executing.CampaignExecution, proto_user_id=0)
-            executions = cast(list[executing.CampaignExecution], executions)
+        if not self._begin_load("Loading executions...", "Load Execution from Database"):
+            return
+        self._run_background_task(
+            lambda: content_api.retrieve_execution_summaries(proto_user_id=0),
+            self.on_executions_loaded,
+            self.on_executions_load_failed,
+        )
+
+    @QtCore.Slot(str)
+    def on_executions_load_failed(self, message: str):
+        """Report a failed execution retrieval."""
+        self._finish_load()
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Loading Execution",
+            f"Failed to load executions from database:\n{message}",
+        )
+
+    def _build_load_execution_dialog(self) -> QtWidgets.QDialog:
+        """Create the Load Execution dialog; its rows are filled in by on_executions_loaded."""
+        dialog = QtWidgets.QDialog(self)
+        dialog.setWindowTitle("Load Execution from Database")
+        dialog.setMinimumWidth(500)
+        dialog.setMinimumHeight(400)
 
+        layout = QtWidgets.QVBoxLayout()
+        label = QtWidgets.QLabel("Select an execution to load:")
+        layout.addWidget(label)
+
+        # Execution list; rows are only formatted when the view paints them
+        execution_model = ExecutionListModel([], dialog)
+        list_view = QtWidgets.QListView()
+        list_view.setModel(execution_model)
+        layout.addWidget(list_view)
+
+        button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+
+        dialog.setLayout(layout)
+
+        self._execution_model = execution_model
+        self._execution_list_view = list_view
+        return dialog
+
+    @QtCore.Slot(object)
+    def on_executions_loaded(self, executions: list[tuple[planning.ID, str, str]]):
+        """Let the user pick one of the retrieved (obj_id, title, session_date) executions to open."""
+        self._finish_load()
+        try:
             if not executions:
                 QtWidgets.QMessageBox.information(
                     self,
@@ -467,45 +877,24 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
                 )
                 return
 
-            dialog = QtWidgets.QDialog(self)
-            dialog.setWindowTitle("Load Execution from Database")
-            dialog.setMinimumWidth(500)
-            dialog.setMinimumHeight(400)
-
-            layout = QtWidgets.QVBoxLayout()
-            label = QtWidgets.QLabel("Select an execution to load:")
-            layout.addWidget(label)
-
-            list_widget = QtWidgets.QListWidget()
-            for ex in executions:
-                item_text = f"{ex.title or 'Untitled Session'} (ID: {ex.obj_id})"
-                if ex.session_date:
-                    item_text += f" - {ex.session_date}"
-                item = QtWidgets.QListWidgetItem(item_text)
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, ex)
-                list_widget.addItem(item)
-
-            list_widget.setCurrentRow(0)
-            layout.addWidget(list_widget)
-
-            button_box = QtWidgets.QDialogButtonBox(
-                QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel
-            )
-            button_box.accepted.connect(dialog.accept)
-            button_box.rejected.connect(dialog.reject)
-            layout.addWidget(button_box)
-
-            dialog.setLayout(layout)
+            # The dialog is built once and refilled on each load
+            if self._load_execution_dialog is None:
+                self._load_execution_dialog = self._build_load_execution_dialog()
+            dialog = self._load_execution_dialog
+            list_view = self._execution_list_view
+            self._execution_model.set_rows(executions)
+            list_view.setCurrentIndex(self._execution_model.index(0))
 
             if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-                current_item = list_widget.currentItem()
-                if current_item:
-                    ex = current_item.data(QtCore.Qt.ItemDataRole.UserRole)
-                    editor = CampaignExecutionEdit(ex)
-                    self.central_widget.addWidget(editor)
-                    self.central_widget.setCurrentWidget(editor)
-                    self.current_editor = editor
-                    self.save_action.setEnabled(True)
+                current = list_view.currentIndex()
+                if current.isValid():
+                    obj_id = current.data(QtCore.Qt.ItemDataRole.UserRole)
+                    # Only the picked execution is loaded in full
+                    self._run_background_task(
+                        lambda: content_api.retrieve_object(obj_id, proto_user_id=0),
+                        self.on_execution_retrieved,
+                        self.on_executions_load_failed,
+                    )
 
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -514,6 +903,15 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
                 f"Failed to load executions from database:\n{str(e)}",
             )
 
+    @QtCore.Slot(object)
+    def on_execution_retrieved(self, execution: executing.CampaignExecution | None):
+        """Open the execution picked in the Load dialog."""
+        if execution is None:
+            QtWidgets.QMessageBox.warning(self, "Execution Not Found", "The selected execution no longer exists.")
+            return
+        self._install_editor(CampaignExecutionEdit(execution))
+
+    @QtCore.Slot()
     def save_execution(self):
         """Save the current execution to database."""
         if not isinstance(self.current_editor, CampaignExecutionEdit):
@@ -521,89 +919,112 @@ class CampaignMasterWindow(QtWidgets.QMainWindow):
 
         try:
             execution = self.current_editor.export_content()
+        except Exception as e:
+            self.on_execution_save_failed(str(e))
+            return
 
-            if self.current_editor.execution is not None:
-                content_api.update_object(execution, proto_user_id=0)
-                message = "Execution saved to database successfully."
-            else:
-                content_api._create_object(execution, proto_user_id=0)
-                message = "Execution created in database successfully."
-                self.current_editor.execution = execution
+        # Save to database off the GUI thread
+        editor = self.current_editor
+        is_new = editor.execution is None
 
-            QtWidgets.QMessageBox.information(self, "Save Successful", message)
+        def save() -> executing.CampaignExecution:
+            if is_new:
+                content_api._create_object(execution, proto_user_id=0)
+            else:
+                content_api.update_object(execution, proto_user_id=0)
+            return execution
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Error Saving Execution",
-                f"Failed to save execution to database:\n{str(e)}",
+        def on_saved(saved: object):
+            if is_new:
+                editor.execution = cast(executing.CampaignExecution, saved)
+            self.on_campaign_saved(
+                "Execution created in database successfully." if is_new else "Execution saved to database successfully."
             )
 
-    def show_about(self):
-        """Show about dialog."""
-        QtWidgets.QMessageBox.about(
+        self.save_action.setEnabled(False)
+        self._run_background_task(save, on_saved, self.on_execution_save_failed)
+
+    @QtCore.Slot(str)
+    def on_execution_save_failed(self, message: str):
+        """Report a failed execution save."""
+        self.save_action.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
             self,
-            "About Campaign Master",
-            "Campaign Master\n\n"
-            "A companion application for TTRPG game masters.\n\n"
-            "Supports campaign planning and execution in both\n"
-            "GUI and web modes.",
+            "Error Saving Execution",
+            f"Failed to save execution to database:\n{message}",
         )
 
+    @QtCore.Slot()
+    def show_about(self):
+        """Show about dialog."""
+        QtWidgets.QMessageBox.about(self, "About Campaign Master", ABOUT_TEXT)
+
+    @QtCore.Slot()
     def show_agent_settings(self):
         """Open the agent configuration dialog."""
         dialog = AgentSettingsDialog(self)
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             self.update_default_agent_menu()
 
+    @QtCore.Slot(bool)
     def toggle_ai_completions(self, enabled: bool):
         """Enable or disable AI completions."""
         AICompletionService.instance().set_enabled(enabled)
 
+    @QtCore.Slot()
     def update_default_agent_menu(self):
-        """Update the default agent submenu from database."""
-        self.default_agent_menu.clear()
-
+        """Update the default agent submenu from database, rebuilding it only if the agents changed."""
         try:
-            agents = content_api.retrieve_objects(planning.AgentConfig, proto_user_id=0)
+            agents = content_api.retrieve_enabled_agents(proto_user_id=0)
+        except Exception:
+            return  # Silently fail if database not ready
 
-            if not agents:
-                no_agents_action = QtGui.QAction("(No agents configured)", self)
-                no_agents_action.setEnabled(False)
-                self.default_agent_menu.addAction(no_agents_action)
-                return
+        signature = tuple((str(a.obj_id), a.name, a.is_default) for a in agents)
+        if signature == self._agents_signature:
+            return
+        self._agents_signature = signature
 
-            action_group = QtGui.QActionGroup(self)
-            action_group.setExclusive(True)
-
-            for agent in agents:
-                agent = cast(planning.AgentConfig, agent)
-                if agent.is_enabled:
-                    action = QtGui.QAction(agent.name or "(unnamed)", self)
-                    action.setCheckable(True)
-                    action.setChecked(agent.is_default)
-                    action.setData(str(agent.obj_id))
-                    action.triggered.connect(
-                        lambda checked, agent_id=str(agent.obj_id): self.set_default_agent(agent_id)
-                    )
-                    action_group.addAction(action)
-                    self.default_agent_menu.addAction(action)
+        # Entries are owned by the menu, so clear() deletes them
+        self.default_agent_menu.clear()
 
-        except Exception:
-            pass  # Silently fail if database not ready
+        if not agents:
+            no_agents_action = QtGui.QAction("(No enabled agents)", self.default_agent_menu)
+            no_agents_action.setEnabled(False)
+            self.default_agent_menu.addAction(no_agents_action)
+            return
 
+        actions = []
+        for agent in agents:
+            action = QtGui.QAction(agent.name or "(unnamed)", self.default_agent_menu)
+            action.setCheckable(True)
+            action.setChecked(agent.is_default)
+            action.setData(str(agent.obj_id))
+            self._agent_action_group.addAction(action)
+            actions.append(action)
+        self.default_agent_menu.addActions(actions)
+
+    @QtCore.Slot(QtGui.QAction)
+    def _on_default_agent_triggered(self, action: QtGui.QAction):
+        """Make the agent behind a Default Agent menu entry the default."""
+        self.set_default_agent(action.data())
+
+    @QtCore.Slot(str)
     def set_default_agent(self, agent_id: str):
         """Set a specific agent as the default."""
         service = AICompletionService.instance()
         if service.set_default_agent_by_id(agent_id):
             # Update is_default flags in database
             try:
-                agents = content_api.retrieve_objects(planning.AgentConfig, proto_user_id=0)
-                for agent in agents:
-                    agent = cast(planning.AgentConfig, agent)
-                    should_be_default = str(agent.obj_id) == agent_id
-                    if agent.is_default != should_be_default:
-                        agent.is_default = should_be_default
-                        content_api.update_object(agent, proto_user_id=0)
+                if content_api.set_default_agent(planning.ID.from_str(agent_id), proto_user_id=0):
+                    # The exclusive action group already checks the new default; record the flags
+                    # the database now holds so the next refresh does not rebuild the menu
+                    if self._agents_signature is not None:
+                        self._agents_signature = tuple(
+                            (obj_id, name, obj_id == agent_id) for obj_id, name, _ in self._agents_signature
+                        )
+                    return
             except Exception:
                 pass
+        # The menu's check marks no longer match the database; resync them
+        self._agents_signature = None
+        self.update_default_agent_menu()
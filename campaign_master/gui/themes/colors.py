@@ -5,28 +5,48 @@ from typing import Tuple
 from ...content import planning
 from .dark_theme import DARK_COLORS
 
-# Map object types to their color scheme (border_color, background_color)
-OBJECT_TYPE_COLORS: dict[type, Tuple[str, str]] = {
-    planning.Rule: (DARK_COLORS.rule_border, DARK_COLORS.rule_bg),
-    planning.Character: (DARK_COLORS.character_border, DARK_COLORS.character_bg),
-    planning.Point: (DARK_COLORS.point_border, DARK_COLORS.point_bg),
-    planning.Arc: (DARK_COLORS.arc_border, DARK_COLORS.arc_bg),
-    planning.Segment: (DARK_COLORS.segment_border, DARK_COLORS.segment_bg),
-    planning.Location: (DARK_COLORS.location_border, DARK_COLORS.location_bg),
-    planning.Item: (DARK_COLORS.item_border, DARK_COLORS.item_bg),
-    planning.Objective: (DARK_COLORS.objective_border, DARK_COLORS.objective_bg),
-    planning.CampaignPlan: (DARK_COLORS.campaign_border, DARK_COLORS.campaign_bg),
+
+def _darken(hex_color: str) -> str:
+    """Scale each channel of a "#rrggbb" color to 60%, for input backgrounds with more contrast."""
+    # Integer-only: c * 3 // 5 is exactly floor(c * 0.6) for every channel value
+    channels = bytes.fromhex(hex_color.lstrip("#"))
+    return "#" + bytes(c * 3 // 5 for c in channels).hex()
+
+
+def _scheme(border_color: str, bg_color: str) -> Tuple[str, str, str]:
+    """Pair a border and background color with the darkened input background derived from it."""
+    return (border_color, bg_color, _darken(bg_color))
+
+
+# Map object types to their color scheme (border_color, background_color, input_background_color)
+OBJECT_TYPE_COLORS: dict[type, Tuple[str, str, str]] = {
+    planning.Rule: _scheme(DARK_COLORS.rule_border, DARK_COLORS.rule_bg),
+    planning.Character: _scheme(DARK_COLORS.character_border, DARK_COLORS.character_bg),
+    planning.Point: _scheme(DARK_COLORS.point_border, DARK_COLORS.point_bg),
+    planning.Arc: _scheme(DARK_COLORS.arc_border, DARK_COLORS.arc_bg),
+    planning.Segment: _scheme(DARK_COLORS.segment_border, DARK_COLORS.segment_bg),
+    planning.Location: _scheme(DARK_COLORS.location_border, DARK_COLORS.location_bg),
+    planning.Item: _scheme(DARK_COLORS.item_border, DARK_COLORS.item_bg),
+    planning.Objective: _scheme(DARK_COLORS.objective_border, DARK_COLORS.objective_bg),
+    planning.CampaignPlan: _scheme(DARK_COLORS.campaign_border, DARK_COLORS.campaign_bg),
 }
 
+DEFAULT_COLORS: Tuple[str, str, str] = _scheme(DARK_COLORS.border_default, DARK_COLORS.primary_bg)
+"""Color scheme for object types without an entry in OBJECT_TYPE_COLORS."""
+
 
-def get_colors_for_type(obj_type: type) -> Tuple[str, str]:
-    """Get (border_color, bg_color) for an object type.
+def get_colors_for_type(obj_type: type) -> Tuple[str, str, str]:
+    """Get (border_color, bg_color, input_bg_color) for an object type.
 
     Args:
         obj_type: The domain object type (e.g., planning.Rule).
 
     Returns:
-        Tuple of (border_color, background_color) as hex strings.
+        Tuple of (border_color, background_color, input_background_color) as hex strings.
         Returns default colors if type not found.
     """
-    return OBJECT_TYPE_COLORS.get(obj_type, (DARK_COLORS.border_default, DARK_COLORS.primary_bg))
+    # Nearly every lookup hits, so index directly rather than going through .get()
+    try:
+        return OBJECT_TYPE_COLORS[obj_type]
+    except KeyError:
+        return DEFAULT_COLORS
@@ -1,12 +1,13 @@
 """Dark theme configuration for Campaign Master GUI."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QPalette
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorScheme:
     """Color definitions for dark theme."""
 
@@ -101,30 +102,42 @@ def create_dark_palette() -> QPalette:
     Returns:
         QPalette configured with dark theme colors.
     """
+    # Hand out a copy so callers can't alter the shared palette
+    return QPalette(_build_dark_palette())
+
+
+@lru_cache(maxsize=1)
+def _build_dark_palette() -> QPalette:
+    """Build the dark theme palette once; create_dark_palette returns copies of it."""
+    # Parse each color used for several roles once
+    primary_bg = QColor(DARK_COLORS.primary_bg)
+    text_primary = QColor(DARK_COLORS.text_primary)
+    text_disabled = QColor(DARK_COLORS.text_disabled)
+
     palette = QPalette()
 
     # Window colors
-    palette.setColor(QPalette.ColorRole.Window, QColor(DARK_COLORS.primary_bg))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(DARK_COLORS.text_primary))
+    palette.setColor(QPalette.ColorRole.Window, primary_bg)
+    palette.setColor(QPalette.ColorRole.WindowText, text_primary)
 
     # Base colors (for text entry widgets)
-    palette.setColor(QPalette.ColorRole.Base, QColor(DARK_COLORS.primary_bg))
+    palette.setColor(QPalette.ColorRole.Base, primary_bg)
     palette.setColor(QPalette.ColorRole.AlternateBase, QColor(DARK_COLORS.secondary_bg))
 
     # Text colors
-    palette.setColor(QPalette.ColorRole.Text, QColor(DARK_COLORS.text_primary))
-    palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(DARK_COLORS.text_disabled))
+    palette.setColor(QPalette.ColorRole.Text, text_primary)
+    palette.setColor(QPalette.ColorRole.PlaceholderText, text_disabled)
 
     # Button colors
     palette.setColor(QPalette.ColorRole.Button, QColor(DARK_COLORS.tertiary_bg))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(DARK_COLORS.text_primary))
+    palette.setColor(QPalette.ColorRole.ButtonText, text_primary)
 
     # Highlight colors
     palette.setColor(QPalette.ColorRole.Highlight, QColor(DARK_COLORS.highlight))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(DARK_COLORS.text_primary))
+    palette.setColor(QPalette.ColorRole.HighlightedText, text_primary)
 
     # Bright text (for tooltips, etc.)
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(DARK_COLORS.text_primary))
+    palette.setColor(QPalette.ColorRole.BrightText, text_primary)
 
     # Link colors
     palette.setColor(QPalette.ColorRole.Link, QColor("#4CAF50"))
@@ -134,17 +147,17 @@ def create_dark_palette() -> QPalette:
     palette.setColor(
         QPalette.ColorGroup.Disabled,
         QPalette.ColorRole.WindowText,
-        QColor(DARK_COLORS.text_disabled),
+        text_disabled,
     )
     palette.setColor(
         QPalette.ColorGroup.Disabled,
         QPalette.ColorRole.Text,
-        QColor(DARK_COLORS.text_disabled),
+        text_disabled,
     )
     palette.setColor(
         QPalette.ColorGroup.Disabled,
         QPalette.ColorRole.ButtonText,
-        QColor(DARK_COLORS.text_disabled),
+        text_disabled,
     )
 
     return palette
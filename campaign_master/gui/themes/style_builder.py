@@ -2,24 +2,15 @@
 
 from .dark_theme import ColorScheme
 
+_BUILT_STYLESHEETS: dict[ColorScheme, str] = {}
+"""Complete stylesheets already built by StyleBuilder.build_all, keyed by color scheme."""
 
-class StyleBuilder:
-    """Builds QSS stylesheets programmatically from ColorScheme."""
-
-    def __init__(self, colors: ColorScheme):
-        """Initialize builder with a color scheme.
 
-        Args:
-            colors: ColorScheme instance defining all theme colors.
-        """
-        self.colors = colors
-
-    def build_buttons(self) -> str:
-        """Build button styles."""
-        return f"""
+# Section templates; StyleBuilder formats each one with its color scheme bound to ``c``
+_BUTTONS_TEMPLATE = """
 QPushButton {{
-    background-color: {self.colors.button_add};
-    color: {self.colors.text_primary};
+    background-color: {c.button_add};
+    color: {c.text_primary};
     border: none;
     border-radius: 4px;
     padding: 10px 16px;
@@ -28,43 +19,42 @@ QPushButton {{
     min-height: 20px;
 }}
 QPushButton:hover {{
-    background-color: {self.colors.button_add_hover};
+    background-color: {c.button_add_hover};
 }}
 QPushButton:pressed {{
-    background-color: {self.colors.button_add_pressed};
+    background-color: {c.button_add_pressed};
 }}
 QPushButton:disabled {{
-    background-color: {self.colors.button_add_disabled};
+    background-color: {c.button_add_disabled};
     color: #c0c0c0;
 }}
 QPushButton:focus {{
-    outline: 2px solid {self.colors.button_add};
+    outline: 2px solid {c.button_add};
     outline-offset: 2px;
 }}
 QDialogButtonBox QPushButton {{
     min-width: 80px;
 }}
 """
+"""Button styles."""
 
-    def build_scrollbars(self) -> str:
-        """Build scrollbar styles."""
-        return f"""
+_SCROLLBARS_TEMPLATE = """
 QScrollBar:vertical {{
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
     width: 12px;
     border: none;
     margin: 0px;
 }}
 QScrollBar::handle:vertical {{
-    background-color: {self.colors.scrollbar_handle};
+    background-color: {c.scrollbar_handle};
     border-radius: 6px;
     min-height: 20px;
 }}
 QScrollBar::handle:vertical:hover {{
-    background-color: {self.colors.scrollbar_handle_hover};
+    background-color: {c.scrollbar_handle_hover};
 }}
 QScrollBar::handle:vertical:pressed {{
-    background-color: {self.colors.scrollbar_handle_pressed};
+    background-color: {c.scrollbar_handle_pressed};
 }}
 QScrollBar::add-line:vertical,
 QScrollBar::sub-line:vertical {{
@@ -75,21 +65,21 @@ QScrollBar::sub-page:vertical {{
     background: none;
 }}
 QScrollBar:horizontal {{
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
     height: 12px;
     border: none;
     margin: 0px;
 }}
 QScrollBar::handle:horizontal {{
-    background-color: {self.colors.scrollbar_handle};
+    background-color: {c.scrollbar_handle};
     border-radius: 6px;
     min-width: 20px;
 }}
 QScrollBar::handle:horizontal:hover {{
-    background-color: {self.colors.scrollbar_handle_hover};
+    background-color: {c.scrollbar_handle_hover};
 }}
 QScrollBar::handle:horizontal:pressed {{
-    background-color: {self.colors.scrollbar_handle_pressed};
+    background-color: {c.scrollbar_handle_pressed};
 }}
 QScrollBar::add-line:horizontal,
 QScrollBar::sub-line:horizontal {{
@@ -100,14 +90,13 @@ QScrollBar::sub-page:horizontal {{
     background: none;
 }}
 """
+"""Scrollbar styles."""
 
-    def build_menus(self) -> str:
-        """Build menu and menubar styles."""
-        return f"""
+_MENUS_TEMPLATE = """
 QMenuBar {{
-    background-color: {self.colors.menu_bg};
-    color: {self.colors.text_primary};
-    border-bottom: 1px solid {self.colors.menu_border};
+    background-color: {c.menu_bg};
+    color: {c.text_primary};
+    border-bottom: 1px solid {c.menu_border};
     padding: 4px;
 }}
 QMenuBar::item {{
@@ -116,15 +105,15 @@ QMenuBar::item {{
     border-radius: 4px;
 }}
 QMenuBar::item:selected {{
-    background-color: {self.colors.menu_item_hover};
+    background-color: {c.menu_item_hover};
 }}
 QMenuBar::item:pressed {{
-    background-color: {self.colors.menu_item_pressed};
+    background-color: {c.menu_item_pressed};
 }}
 QMenu {{
-    background-color: {self.colors.primary_bg};
-    color: {self.colors.text_primary};
-    border: 1px solid {self.colors.border_default};
+    background-color: {c.primary_bg};
+    color: {c.text_primary};
+    border: 1px solid {c.border_default};
     border-radius: 4px;
     padding: 4px;
 }}
@@ -133,65 +122,62 @@ QMenu::item {{
     border-radius: 4px;
 }}
 QMenu::item:selected {{
-    background-color: {self.colors.highlight};
+    background-color: {c.highlight};
 }}
 QMenu::separator {{
     height: 1px;
-    background-color: {self.colors.border_default};
+    background-color: {c.border_default};
     margin: 4px 0px;
 }}
 """
+"""Menu and menubar styles."""
 
-    def build_toolbar(self) -> str:
-        """Build toolbar styles."""
-        return f"""
+_TOOLBAR_TEMPLATE = """
 QToolBar {{
-    background-color: {self.colors.menu_bg};
-    border-bottom: 1px solid {self.colors.menu_border};
+    background-color: {c.menu_bg};
+    border-bottom: 1px solid {c.menu_border};
     spacing: 8px;
     padding: 4px;
 }}
 QToolButton {{
     background-color: transparent;
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
     border: none;
     border-radius: 4px;
     padding: 8px 16px;
     font-size: 14px;
 }}
 QToolButton:hover {{
-    background-color: {self.colors.menu_item_hover};
+    background-color: {c.menu_item_hover};
 }}
 QToolButton:pressed {{
-    background-color: {self.colors.menu_item_pressed};
+    background-color: {c.menu_item_pressed};
 }}
 """
+"""Toolbar styles."""
 
-    def build_statusbar(self) -> str:
-        """Build status bar styles."""
-        return f"""
+_STATUSBAR_TEMPLATE = """
 QStatusBar {{
-    background-color: {self.colors.menu_bg};
-    color: {self.colors.text_primary};
-    border-top: 1px solid {self.colors.menu_border};
+    background-color: {c.menu_bg};
+    color: {c.text_primary};
+    border-top: 1px solid {c.menu_border};
 }}
 QStatusBar::item {{
     border: none;
 }}
 """
+"""Status bar styles."""
 
-    def build_tabs(self) -> str:
-        """Build tab widget styles."""
-        return f"""
+_TABS_TEMPLATE = """
 QTabWidget::pane {{
-    border: 1px solid {self.colors.border_default};
+    border: 1px solid {c.border_default};
     border-radius: 4px;
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
 }}
 QTabBar::tab {{
-    background-color: {self.colors.tab_bg};
-    color: {self.colors.text_primary};
-    border: 1px solid {self.colors.border_default};
+    background-color: {c.tab_bg};
+    color: {c.text_primary};
+    border: 1px solid {c.border_default};
     border-bottom: none;
     border-top-left-radius: 4px;
     border-top-right-radius: 4px;
@@ -199,90 +185,88 @@ QTabBar::tab {{
     margin-right: 2px;
 }}
 QTabBar::tab:selected {{
-    background-color: {self.colors.tab_selected_bg};
-    border-bottom: 1px solid {self.colors.tab_selected_bg};
+    background-color: {c.tab_selected_bg};
+    border-bottom: 1px solid {c.tab_selected_bg};
 }}
 QTabBar::tab:hover {{
-    background-color: {self.colors.highlight};
+    background-color: {c.highlight};
 }}
 """
+"""Tab widget styles."""
 
-    def build_controls(self) -> str:
-        """Build checkbox, radio button, and slider styles."""
-        return f"""
+_CONTROLS_TEMPLATE = """
 QCheckBox {{
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
     spacing: 8px;
 }}
 QCheckBox::indicator {{
     width: 18px;
     height: 18px;
-    border: 1px solid {self.colors.border_default};
+    border: 1px solid {c.border_default};
     border-radius: 4px;
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
 }}
 QCheckBox::indicator:hover {{
-    border: 1px solid {self.colors.button_add};
+    border: 1px solid {c.button_add};
 }}
 QCheckBox::indicator:checked {{
-    background-color: {self.colors.button_add};
-    border: 1px solid {self.colors.button_add};
+    background-color: {c.button_add};
+    border: 1px solid {c.button_add};
 }}
 QCheckBox::indicator:disabled {{
-    border: 1px solid {self.colors.disabled_border};
-    background-color: {self.colors.disabled_bg};
+    border: 1px solid {c.disabled_border};
+    background-color: {c.disabled_bg};
 }}
 QRadioButton {{
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
     spacing: 8px;
 }}
 QRadioButton::indicator {{
     width: 18px;
     height: 18px;
-    border: 1px solid {self.colors.border_default};
+    border: 1px solid {c.border_default};
     border-radius: 9px;
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
 }}
 QRadioButton::indicator:hover {{
-    border: 1px solid {self.colors.button_add};
+    border: 1px solid {c.button_add};
 }}
 QRadioButton::indicator:checked {{
-    background-color: {self.colors.button_add};
-    border: 1px solid {self.colors.button_add};
+    background-color: {c.button_add};
+    border: 1px solid {c.button_add};
 }}
 QRadioButton::indicator:disabled {{
-    border: 1px solid {self.colors.disabled_border};
-    background-color: {self.colors.disabled_bg};
+    border: 1px solid {c.disabled_border};
+    background-color: {c.disabled_bg};
 }}
 QSlider::groove:horizontal {{
-    background-color: {self.colors.tertiary_bg};
+    background-color: {c.tertiary_bg};
     height: 4px;
     border-radius: 2px;
 }}
 QSlider::handle:horizontal {{
-    background-color: {self.colors.button_add};
+    background-color: {c.button_add};
     width: 16px;
     height: 16px;
     margin: -6px 0;
     border-radius: 8px;
 }}
 QSlider::handle:horizontal:hover {{
-    background-color: {self.colors.button_add_hover};
+    background-color: {c.button_add_hover};
 }}
 """
+"""Checkbox, radio button, and slider styles."""
 
-    def build_misc(self) -> str:
-        """Build tooltip, splitter, and progress bar styles."""
-        return f"""
+_MISC_TEMPLATE = """
 QToolTip {{
-    background-color: {self.colors.tooltip_bg};
-    color: {self.colors.text_primary};
-    border: 1px solid {self.colors.border_default};
+    background-color: {c.tooltip_bg};
+    color: {c.text_primary};
+    border: 1px solid {c.border_default};
     border-radius: 4px;
     padding: 4px 8px;
 }}
 QSplitter::handle {{
-    background-color: {self.colors.splitter_handle};
+    background-color: {c.splitter_handle};
     border-radius: 2px;
 }}
 QSplitter::handle:horizontal {{
@@ -294,42 +278,90 @@ QSplitter::handle:vertical {{
     margin: 0 2px;
 }}
 QSplitter::handle:hover {{
-    background-color: {self.colors.splitter_handle_hover};
+    background-color: {c.splitter_handle_hover};
 }}
 QSplitter::handle:pressed {{
-    background-color: {self.colors.splitter_handle_pressed};
+    background-color: {c.splitter_handle_pressed};
 }}
 QProgressBar {{
-    background-color: {self.colors.progress_bg};
-    border: 1px solid {self.colors.border_default};
+    background-color: {c.progress_bg};
+    border: 1px solid {c.border_default};
     border-radius: 4px;
     text-align: center;
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
     height: 20px;
 }}
 QProgressBar::chunk {{
-    background-color: {self.colors.progress_chunk};
+    background-color: {c.progress_chunk};
     border-radius: 3px;
 }}
 """
+"""Tooltip, splitter, and progress bar styles."""
 
-    def build_forms(self) -> str:
-        """Build form, dialog, and label styles."""
-        return f"""
+_FORMS_TEMPLATE = """
 QLabel {{
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
 }}
 QDialog {{
-    background-color: {self.colors.primary_bg};
+    background-color: {c.primary_bg};
 }}
 QDialogButtonBox QPushButton {{
     min-width: 80px;
     padding: 6px 16px;
 }}
 QGroupBox {{
-    color: {self.colors.text_primary};
+    color: {c.text_primary};
 }}
 """
+"""Form, dialog, and label styles."""
+
+
+class StyleBuilder:
+    """Builds QSS stylesheets programmatically from ColorScheme."""
+
+    def __init__(self, colors: ColorScheme):
+        """Initialize builder with a color scheme.
+
+        Args:
+            colors: ColorScheme instance defining all theme colors.
+        """
+        self.colors = colors
+
+    def build_buttons(self) -> str:
+        """Build button styles."""
+        return _BUTTONS_TEMPLATE.format(c=self.colors)
+
+    def build_scrollbars(self) -> str:
+        """Build scrollbar styles."""
+        return _SCROLLBARS_TEMPLATE.format(c=self.colors)
+
+    def build_menus(self) -> str:
+        """Build menu and menubar styles."""
+        return _MENUS_TEMPLATE.format(c=self.colors)
+
+    def build_toolbar(self) -> str:
+        """Build toolbar styles."""
+        return _TOOLBAR_TEMPLATE.format(c=self.colors)
+
+    def build_statusbar(self) -> str:
+        """Build status bar styles."""
+        return _STATUSBAR_TEMPLATE.format(c=self.colors)
+
+    def build_tabs(self) -> str:
+        """Build tab widget styles."""
+        return _TABS_TEMPLATE.format(c=self.colors)
+
+    def build_controls(self) -> str:
+        """Build checkbox, radio button, and slider styles."""
+        return _CONTROLS_TEMPLATE.format(c=self.colors)
+
+    def build_misc(self) -> str:
+        """Build tooltip, splitter, and progress bar styles."""
+        return _MISC_TEMPLATE.format(c=self.colors)
+
+    def build_forms(self) -> str:
+        """Build form, dialog, and label styles."""
+        return _FORMS_TEMPLATE.format(c=self.colors)
 
     def build_all(self) -> str:
         """Build complete stylesheet by combining all style sections.
@@ -337,6 +369,11 @@ QGroupBox {{
         Returns:
             Complete QSS stylesheet string.
         """
+        # Schemes are frozen and compare by value, so equal schemes share one stylesheet
+        stylesheet = _BUILT_STYLESHEETS.get(self.colors)
+        if stylesheet is not None:
+            return stylesheet
+
         sections = [
             self.build_buttons(),
             self.build_scrollbars(),
@@ -348,4 +385,6 @@ QGroupBox {{
             self.build_misc(),
             self.build_forms(),
         ]
-        return "\n".join(sections)
+        stylesheet = "\n".join(sections)
+        _BUILT_STYLESHEETS[self.colors] = stylesheet
+        return stylesheet
@@ -238,7 +238,6 @@ class CampaignExecutionEdit(QtWidgets.QWidget, ThemedWidget):
         self.plan_select.addItem("-- None --", "")
         try:
             plans = content_api.retrieve_objects(planning.CampaignPlan, proto_user_id=0)
-            plans = cast(list[planning.CampaignPlan], plans)
             for plan in plans:
                 label = f"{plan.title or 'Untitled'} ({plan.obj_id})"
                 self.plan_select.addItem(label, str(plan.obj_id))
@@ -1563,7 +1563,18 @@ class CampaignPlanEdit(QtWidgets.QWidget, ThemedWidget):
     def __init__(self, campaign_plan: Optional[planning.CampaignPlan] = None, parent=None):
         super().__init__(parent)
         self.campaign_plan = campaign_plan
-        self.init_ui()
+        # The widget tree is built on first show (or first read), not here
+        self._built = False
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """Build the form the first time it is needed."""
+        if not self._built:
+            self._built = True
+            self.init_ui()
 
     def init_ui(self):
         from ..themes.colors import get_colors_for_type
@@ -1575,7 +1586,7 @@ class CampaignPlanEdit(QtWidgets.QWidget, ThemedWidget):
 
         # Metadata section (non-collapsible)
         metadata_group = QtWidgets.QGroupBox("Campaign Metadata")
-        border_color, bg_color = get_colors_for_type(planning.CampaignPlan)
+        border_color, bg_color, _ = get_colors_for_type(planning.CampaignPlan)
         metadata_group.setStyleSheet(
             f"""
             QGroupBox {{
@@ -1694,7 +1705,7 @@ class CampaignPlanEdit(QtWidgets.QWidget, ThemedWidget):
         sections_layout.setSpacing(8)
 
         for title, widget, ObjectType in sections:
-            border_color, bg_color = get_colors_for_type(ObjectType)
+            border_color, bg_color, _ = get_colors_for_type(ObjectType)
             section = CollapsibleSection(title, border_color, bg_color)
             section.set_content(widget)
             sections_layout.addWidget(section)
@@ -1732,6 +1743,7 @@ class CampaignPlanEdit(QtWidgets.QWidget, ThemedWidget):
 
     def _get_entity_context(self) -> dict[str, Any]:
         """Get current entity data for AI context."""
+        self._ensure_built()
         return {
             "campaign": {
                 "title": self.title.text(),
@@ -1751,6 +1763,7 @@ class CampaignPlanEdit(QtWidgets.QWidget, ThemedWidget):
 
     def export_content(self) -> planning.CampaignPlan:
         """Export the form data as a CampaignPlan object."""
+        self._ensure_built()
         return planning.CampaignPlan(
             obj_id=self.obj_id.get_id(),  # type: ignore[arg-type]
             title=self.title.text(),
@@ -2,6 +2,7 @@ import contextlib
 import logging
 import os
 import sys
+import tempfile
 import threading
 from pathlib import Path
 
@@ -36,6 +37,29 @@ def get_resource_path(relative_path: str) -> Path:
     return Path(__file__).parent.parent / relative_path
 
 
+def write_bytes_atomic(path: str | Path, data: bytes) -> None:
+    """
+    Write data to path so readers never see a partially written file.
+
+    The bytes are written to a temporary file in the same directory, which
+    then replaces the target in a single rename.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
 def get_basic_formatter() -> logging.Formatter:
     return logging.Formatter(
         "[%(name)s:%(levelname)s](%(asctime)s):`%(message)s`",
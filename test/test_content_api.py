@@ -4,7 +4,7 @@ import pytest
 from sqlalchemy import func, select
 
 from campaign_master.content import api as content_api
-from campaign_master.content import planning
+from campaign_master.content import executing, planning
 from campaign_master.content.database import get_session_factory, transaction
 from campaign_master.content.models import ObjectID
 
@@ -362,3 +362,212 @@ class TestNoDuplicateObjectIDs:
         # Verify total count is exactly 5
         total_count = self._get_total_object_id_count()
         assert total_count == 5, f"Expected 5 total ObjectIDs, found {total_count}"
+
+
+class TestUnsetDefaultAgents:
+    """Tests for the bulk default-agent reset."""
+
+    def _make_agent(self, is_default: bool, proto_user_id: int = 0) -> planning.AgentConfig:
+        agent = content_api.create_object(planning.AgentConfig, proto_user_id=proto_user_id)
+        assert isinstance(agent, planning.AgentConfig)
+        agent.is_default = is_default
+        content_api.update_object(agent, proto_user_id=proto_user_id)
+        return agent
+
+    def test_clears_all_defaults(self, db_session):
+        """Every default agent should be cleared when no exception is given."""
+        self._make_agent(True)
+        self._make_agent(True)
+        self._make_agent(False)
+
+        assert content_api.unset_default_agents() == 2
+        agents = content_api.retrieve_objects(planning.AgentConfig)
+        assert not any(a.is_default for a in agents if isinstance(a, planning.AgentConfig))
+
+    def test_keeps_excepted_agent(self, db_session):
+        """The excepted agent should keep its default flag."""
+        keep = self._make_agent(True)
+        self._make_agent(True)
+
+        assert content_api.unset_default_agents(except_id=keep.obj_id) == 1
+        retrieved = content_api.retrieve_object(keep.obj_id)
+        assert isinstance(retrieved, planning.AgentConfig)
+        assert retrieved.is_default
+
+    def test_scoped_to_user(self, db_session):
+        """Agents owned by another user should not be touched."""
+        other = self._make_agent(True, proto_user_id=1)
+        self._make_agent(True)
+
+        assert content_api.unset_default_agents() == 1
+        retrieved = content_api.retrieve_object(other.obj_id, proto_user_id=1)
+        assert isinstance(retrieved, planning.AgentConfig)
+        assert retrieved.is_default
+
+
+class TestSetDefaultAgent:
+    """Tests for switching the default agent."""
+
+    def _make_agent(self, is_default: bool) -> planning.AgentConfig:
+        agent = content_api.create_object(planning.AgentConfig)
+        assert isinstance(agent, planning.AgentConfig)
+        agent.is_default = is_default
+        content_api.update_object(agent)
+        return agent
+
+    def _default_ids(self) -> list[planning.ID]:
+        agents = content_api.retrieve_objects(planning.AgentConfig)
+        return [a.obj_id for a in agents if isinstance(a, planning.AgentConfig) and a.is_default]
+
+    def test_moves_default_flag(self, db_session):
+        """The chosen agent should become the only default."""
+        self._make_agent(True)
+        target = self._make_agent(False)
+        self._make_agent(False)
+
+        assert content_api.set_default_agent(target.obj_id)
+        assert self._default_ids() == [target.obj_id]
+
+    def test_missing_agent(self, db_session):
+        """An unknown agent should report False and leave no default behind."""
+        self._make_agent(True)
+
+        assert not content_api.set_default_agent(planning.ID(prefix="AG", numeric=9999))
+        assert self._default_ids() == []
+
+
+class TestUpdateAgent:
+    """Tests for saving an agent together with its default flag."""
+
+    def test_default_clears_others(self, db_session):
+        """Saving a default agent should clear every other default in the same call."""
+        agents = [content_api.create_object(planning.AgentConfig) for _ in range(3)]
+        for agent in agents[:2]:
+            assert isinstance(agent, planning.AgentConfig)
+            agent.is_default = True
+            content_api.update_object(agent)
+
+        target = agents[2]
+        assert isinstance(target, planning.AgentConfig)
+        target.is_default = True
+        target.name = "Chosen"
+        content_api.update_agent(target)
+
+        saved = content_api.retrieve_objects(planning.AgentConfig)
+        assert [a.obj_id for a in saved if a.is_default] == [target.obj_id]
+        assert saved[2].name == "Chosen"
+
+    def test_non_default_leaves_others(self, db_session):
+        """Saving a non-default agent should not touch the existing default."""
+        default, other = (content_api.create_object(planning.AgentConfig) for _ in range(2))
+        assert isinstance(default, planning.AgentConfig) and isinstance(other, planning.AgentConfig)
+        default.is_default = True
+        content_api.update_object(default)
+
+        other.name = "Renamed"
+        content_api.update_agent(other)
+
+        assert content_api.retrieve_object(default.obj_id).is_default
+        assert content_api.retrieve_object(other.obj_id).name == "Renamed"
+
+
+class TestRetrieveEnabledAgents:
+    """Tests for the enabled-agent query behind the Default Agent menu."""
+
+    def test_skips_disabled_and_other_users(self, db_session):
+        """Only the user's enabled agents should be returned, in creation order."""
+        agents = [content_api.create_object(planning.AgentConfig) for _ in range(3)]
+        for agent, enabled in zip(agents, (True, False, True)):
+            assert isinstance(agent, planning.AgentConfig)
+            agent.is_enabled = enabled
+        content_api.bulk_update_objects(agents)
+        content_api.create_object(planning.AgentConfig, proto_user_id=1)
+
+        assert [a.obj_id for a in content_api.retrieve_enabled_agents()] == [agents[0].obj_id, agents[2].obj_id]
+
+
+class TestBulkUpdateObjects:
+    """Tests for updating several objects in one transaction."""
+
+    def test_updates_all_objects(self, db_session):
+        """Every object passed in should be persisted."""
+        rules = [content_api.create_object(planning.Rule) for _ in range(3)]
+        for i, rule in enumerate(rules):
+            assert isinstance(rule, planning.Rule)
+            rule.description = f"rule {i}"
+
+        updated = content_api.bulk_update_objects(rules)
+
+        assert [r.obj_id for r in updated] == [r.obj_id for r in rules]
+        for i, rule in enumerate(rules):
+            retrieved = content_api.retrieve_object(rule.obj_id)
+            assert isinstance(retrieved, planning.Rule)
+            assert retrieved.description == f"rule {i}"
+
+    def test_missing_object_rolls_back(self, db_session):
+        """A missing object should abort the whole batch."""
+        rule = content_api.create_object(planning.Rule)
+        assert isinstance(rule, planning.Rule)
+        rule.description = "changed"
+        missing = planning.Rule(obj_id=planning.ID(prefix="R", numeric=9999))
+
+        with pytest.raises(ValueError):
+            content_api.bulk_update_objects([rule, missing])
+
+        retrieved = content_api.retrieve_object(rule.obj_id)
+        assert isinstance(retrieved, planning.Rule)
+        assert retrieved.description != "changed"
+
+
+class TestDeleteObjects:
+    """Tests for deleting several objects in one transaction."""
+
+    def test_deletes_all_and_counts(self, db_session):
+        """Every existing ID should be deleted and counted; unknown IDs are skipped."""
+        keep = content_api.create_object(planning.Rule)
+        doomed = [content_api.create_object(planning.Rule) for _ in range(2)]
+        missing = planning.ID(prefix="R", numeric=9999)
+
+        deleted = content_api.delete_objects([r.obj_id for r in doomed] + [missing])
+
+        assert deleted == 2
+        assert [r.obj_id for r in content_api.retrieve_objects(planning.Rule)] == [keep.obj_id]
+
+
+class TestRetrieveCampaignSummaries:
+    """Tests for the campaign picker projection."""
+
+    def test_returns_id_title_summary(self, db_session):
+        """Each campaign should be listed with its ID, title and summary."""
+        first = content_api.create_object(planning.CampaignPlan)
+        second = content_api.create_object(planning.CampaignPlan)
+        assert isinstance(first, planning.CampaignPlan) and isinstance(second, planning.CampaignPlan)
+        first.title, first.summary = "First", "Summary one"
+        second.title = "Second"
+        content_api.bulk_update_objects([first, second])
+
+        assert content_api.retrieve_campaign_summaries() == [
+            (first.obj_id, "First", "Summary one"),
+            (second.obj_id, "Second", ""),
+        ]
+
+    def test_scoped_to_user(self, db_session):
+        """Campaigns owned by another user should not be listed."""
+        content_api.create_object(planning.CampaignPlan, proto_user_id=1)
+
+        assert content_api.retrieve_campaign_summaries() == []
+        assert len(content_api.retrieve_campaign_summaries(proto_user_id=1)) == 1
+
+
+class TestRetrieveExecutionSummaries:
+    """Tests for the execution picker projection."""
+
+    def test_returns_id_title_session_date(self, db_session):
+        """Each execution should be listed with its ID, title and session date."""
+        execution = content_api.create_object(executing.CampaignExecution)
+        assert isinstance(execution, executing.CampaignExecution)
+        execution.title, execution.session_date = "Session 1", "2025-01-04"
+        content_api.update_object(execution)
+        content_api.create_object(executing.CampaignExecution, proto_user_id=1)
+
+        assert content_api.retrieve_execution_summaries() == [(execution.obj_id, "Session 1", "2025-01-04")]
@@ -0,0 +1,402 @@
+"""Tests for the AgentSettingsDialog."""
+
+import gc
+import os
+import subprocess
+import sys
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _can_create_qapp() -> bool:
+    """Check whether QApplication can be created without aborting the process."""
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import os; os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen'); "
+                "from PySide6.QtWidgets import QApplication; QApplication([])",
+            ],
+            timeout=10,
+            capture_output=True,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+_gui_available = _can_create_qapp()
+pytestmark = pytest.mark.skipif(not _gui_available, reason="Cannot create QApplication")
+
+if _gui_available:
+    if "QT_QPA_PLATFORM" not in os.environ and not os.environ.get("DISPLAY"):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+from PySide6 import QtCore, QtWidgets
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Module-scoped QApplication for all GUI tests."""
+    if "QT_QPA_PLATFORM" not in os.environ and not os.environ.get("DISPLAY"):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def dialog_cls():
+    """AgentSettingsDialog with an empty model cache."""
+    from campaign_master.gui.dialogs.agent_settings import AgentSettingsDialog
+
+    AgentSettingsDialog._models_cache.clear()
+    yield AgentSettingsDialog
+    AgentSettingsDialog._models_cache.clear()
+
+
+class TestResolveApiKey:
+    """Tests for $ENV_VAR API key references."""
+
+    def test_literal_key_is_unchanged(self):
+        """A plain key should be returned as-is."""
+        from campaign_master.gui.dialogs.agent_settings import _resolve_api_key
+
+        assert _resolve_api_key("sk-123") == ("sk-123", None)
+
+    def test_env_reference_is_resolved(self, monkeypatch):
+        """A $VAR reference should be replaced by the variable's value."""
+        from campaign_master.gui.dialogs.agent_settings import _resolve_api_key
+
+        monkeypatch.setenv("CM_TEST_KEY", "secret")
+        assert _resolve_api_key("$CM_TEST_KEY") == ("secret", None)
+
+    def test_unset_env_reference_reports_error(self, monkeypatch):
+        """An unset variable should produce an error message."""
+        from campaign_master.gui.dialogs.agent_settings import _resolve_api_key
+
+        monkeypatch.delenv("CM_TEST_KEY", raising=False)
+        assert _resolve_api_key("$CM_TEST_KEY") == ("", "Environment variable CM_TEST_KEY not set")
+
+
+class TestModelCache:
+    """Tests for the per-provider model list cache."""
+
+    def test_models_fetched_once_per_provider(self, dialog_cls):
+        """Repeated lookups for the same provider should not re-instantiate it."""
+        provider = MagicMock()
+        provider.get_available_models.return_value = ["m1", "m2"]
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", return_value=provider) as factory:
+            assert dialog_cls.get_available_models("anthropic") == ["m1", "m2"]
+            assert dialog_cls.get_available_models("anthropic") == ["m1", "m2"]
+        assert factory.call_count == 1
+
+    def test_failed_lookup_is_not_cached(self, dialog_cls):
+        """A provider error should return no models and allow a later retry."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError("boom")):
+            assert dialog_cls.get_available_models("anthropic") == []
+        assert "anthropic" not in dialog_cls._models_cache
+
+    def test_refresh_refetches_models(self, qapp, db_session, dialog_cls):
+        """The Refresh button should drop the cache entry and query the provider again."""
+        provider = MagicMock()
+        provider.get_available_models.return_value = ["m1"]
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", return_value=provider) as factory:
+            dialog = dialog_cls()
+            dialog.add_agent()
+            calls = factory.call_count
+            dialog.refresh_models()
+        assert factory.call_count == calls + 1
+
+
+class TestLazyForm:
+    """Tests for building the configuration form on demand."""
+
+    def test_form_built_on_first_selection(self, qapp, db_session, dialog_cls):
+        """The form should only be constructed once an agent is selected."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            assert not dialog._form_built
+            assert not hasattr(dialog, "name_edit")
+
+            dialog.add_agent()
+            form = dialog.form_stack.currentWidget()
+            assert dialog._form_built
+            assert dialog.name_edit.text() == "New Agent"
+
+            dialog.add_agent()
+        assert dialog.form_stack.currentWidget() is form
+        assert dialog.form_stack.count() == 2
+
+    def test_api_key_row_has_label(self, qapp, db_session, dialog_cls):
+        """The API key field and its Show button should share one labelled row."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+        form_layout = dialog.name_edit.parentWidget().layout()
+        labels = [
+            form_layout.itemAt(row, QtWidgets.QFormLayout.ItemRole.LabelRole).widget().text()
+            for row in range(form_layout.rowCount())
+            if form_layout.itemAt(row, QtWidgets.QFormLayout.ItemRole.LabelRole)
+        ]
+        assert labels.count("API Key:") == 1
+        assert labels[labels.index("API Key:") + 1] == "Base URL:"
+
+
+class TestLazyModelCombo:
+    """Tests for deferring the model list until the combo popup opens."""
+
+    def test_provider_switch_does_not_fetch_models(self, qapp, db_session, dialog_cls):
+        """Changing provider should not query the provider until the popup is shown."""
+        provider = MagicMock()
+        provider.get_available_models.return_value = ["m1", "m2"]
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", return_value=provider) as factory:
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.on_provider_changed("openai")
+            dialog.model_combo.setCurrentText("custom-model")
+            assert factory.call_count == 0
+
+            with patch.object(QtWidgets.QComboBox, "showPopup"):
+                dialog.model_combo.showPopup()
+                dialog.model_combo.showPopup()
+        assert factory.call_count == 1
+        assert dialog.model_combo.count() == 2
+        assert dialog.model_combo.currentText() == "custom-model"
+
+    def test_same_provider_keeps_models(self, qapp, db_session, dialog_cls):
+        """Selecting another agent with the same provider should not reset the model list."""
+        provider = MagicMock()
+        provider.get_available_models.return_value = ["m1", "m2"]
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", return_value=provider):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.add_agent()
+            with patch.object(QtWidgets.QComboBox, "showPopup"):
+                dialog.model_combo.showPopup()
+            with patch.object(dialog.model_combo, "set_provider_type") as set_provider_type:
+                dialog.agent_list.setCurrentIndex(dialog.agent_model.index(0))
+        set_provider_type.assert_not_called()
+        assert dialog.model_combo.count() == 2
+
+
+class TestConnectionProbe:
+    """Tests for the Test Connection button."""
+
+    def test_rapid_clicks_are_throttled(self, qapp, db_session, dialog_cls):
+        """A second click inside the throttle window should not start another probe."""
+        service = MagicMock()
+        service.test_connection.return_value = (True, "ok")
+        with patch("campaign_master.gui.dialogs.agent_settings.AICompletionService") as service_cls:
+            service_cls.instance.return_value = service
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.test_connection()
+            dialog.test_connection()
+            QtCore.QThreadPool.globalInstance().waitForDone()
+        assert service.test_connection.call_count == 1
+
+    def test_probe_runs_off_gui_thread(self, qapp, db_session, dialog_cls):
+        """The probe should run in the thread pool and report back through a signal."""
+        probe_threads = []
+
+        def fake_test_connection(*args):
+            probe_threads.append(QtCore.QThread.currentThread())
+            return True, "pong"
+
+        service = MagicMock()
+        service.test_connection.side_effect = fake_test_connection
+        with patch("campaign_master.gui.dialogs.agent_settings.AICompletionService") as service_cls:
+            service_cls.instance.return_value = service
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.test_connection()
+            assert dialog.status_label.text() == "Testing connection..."
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+        assert probe_threads and probe_threads[0] is not qapp.thread()
+        assert dialog.status_label.text() == "Success: pong"
+        assert dialog._test_signals is None
+
+    def test_cancelled_probe_result_is_ignored(self, qapp, db_session, dialog_cls):
+        """A result arriving after cancellation should not overwrite the status label."""
+        service = MagicMock()
+        service.test_connection.return_value = (False, "stale")
+        with patch("campaign_master.gui.dialogs.agent_settings.AICompletionService") as service_cls:
+            service_cls.instance.return_value = service
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.test_connection()
+            dialog.cancel_test_connection()
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+        assert dialog.status_label.text() == "Testing connection..."
+
+    @pytest.mark.parametrize("cancel", [False, True])
+    def test_probe_worker_is_released(self, qapp, db_session, dialog_cls, cancel):
+        """Finished and cancelled probes should not keep their worker or signals alive."""
+        from campaign_master.gui.dialogs import agent_settings
+
+        refs = []
+        original = agent_settings.ConnectionTestWorker
+
+        def make_worker(*args):
+            worker = original(*args)
+            refs.extend([weakref.ref(worker), weakref.ref(worker.signals)])
+            return worker
+
+        service = MagicMock()
+        service.test_connection.return_value = (True, "pong")
+        with (
+            patch("campaign_master.gui.dialogs.agent_settings.AICompletionService") as service_cls,
+            patch.object(agent_settings, "ConnectionTestWorker", side_effect=make_worker),
+        ):
+            service_cls.instance.return_value = service
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.test_connection()
+            if cancel:
+                dialog.cancel_test_connection()
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+        gc.collect()
+        assert dialog._test_signals is None
+        assert len(refs) == 2
+        assert all(ref() is None for ref in refs)
+
+
+class TestAgentListMutation:
+    """Tests for adding and removing agents without reloading the list."""
+
+    def test_add_and_remove_skip_reload(self, qapp, db_session, dialog_cls):
+        """Adding and removing an agent should update the list in place."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            start = dialog.agent_model.rowCount()
+            with patch.object(dialog, "load_agents") as load_agents:
+                dialog.add_agent()
+                assert dialog.agent_model.rowCount() == start + 1
+                assert dialog.agent_list.currentIndex().row() == start
+                assert dialog._current_agent is dialog._agents[-1]
+
+                with patch.object(
+                    QtWidgets.QMessageBox, "question", return_value=QtWidgets.QMessageBox.StandardButton.Yes
+                ):
+                    dialog.remove_agent()
+            load_agents.assert_not_called()
+        assert dialog.agent_model.rowCount() == start
+        assert len(dialog._agents) == start
+
+    def test_reload_runs_selection_slot_once(self, qapp, db_session, dialog_cls):
+        """on_agent_selected should run once for a reload, not for every row."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.add_agent()
+            with patch.object(dialog, "clear_form", wraps=dialog.clear_form) as clear_form:
+                dialog.load_agents()
+        assert clear_form.call_count == 1
+        assert dialog.agent_model.rowCount() == 2
+        assert dialog._current_agent is None
+
+    def test_model_data(self, qapp, db_session, dialog_cls):
+        """The model should label the default agent and gray out disabled ones."""
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.add_agent()
+        dialog._agents[0].is_default = True
+        dialog._agents[1].is_enabled = False
+        model = dialog.agent_model
+        first, second = model.index(0), model.index(1)
+
+        assert model.data(first) == "New Agent (default)"
+        assert model.data(second) == "New Agent"
+        assert model.data(second, QtCore.Qt.ItemDataRole.UserRole) is dialog._agents[1]
+        assert model.data(first, QtCore.Qt.ItemDataRole.ForegroundRole) is None
+        assert model.data(second, QtCore.Qt.ItemDataRole.ForegroundRole) == dialog._disabled_agent_brush
+
+    def test_save_default_clears_previous_default(self, qapp, db_session, dialog_cls):
+        """Making an agent default should clear the old default in the same save."""
+        from campaign_master.content import api as content_api
+
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            old_default = dialog._current_agent
+            dialog.default_checkbox.setChecked(True)
+            assert dialog.save_current_agent()
+
+            dialog.add_agent()
+            dialog.default_checkbox.setChecked(True)
+            with patch.object(content_api, "update_object", wraps=content_api.update_object) as update:
+                assert dialog.save_current_agent()
+        # Only the new default is written in full; the old one is cleared by a single UPDATE
+        assert update.call_count == 1
+        retrieved = content_api.retrieve_object(old_default.obj_id)
+        assert not retrieved.is_default
+        assert not old_default.is_default
+        assert dialog._current_agent.is_default
+
+    def test_save_default_clears_default_outside_snapshot(self, qapp, db_session, dialog_cls):
+        """A default set after the dialog loaded its agents should still be cleared."""
+        from campaign_master.content import api as content_api
+        from campaign_master.content import planning
+
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            outside = content_api.create_object(planning.AgentConfig)
+            assert isinstance(outside, planning.AgentConfig)
+            outside.is_default = True
+            content_api.update_object(outside)
+
+            dialog.default_checkbox.setChecked(True)
+            assert dialog.save_current_agent()
+        assert not content_api.retrieve_object(outside.obj_id).is_default
+        assert content_api.retrieve_object(dialog._current_agent.obj_id).is_default
+
+    def test_opening_model_popup_is_not_an_edit(self, qapp, db_session, dialog_cls):
+        """Loading the model list on first popup should not mark the agent as changed."""
+        from campaign_master.content import api as content_api
+
+        provider = MagicMock()
+        provider.get_available_models.return_value = ["a", "gpt-4o"]
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", return_value=provider):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            dialog.model_combo.setCurrentText("gpt-4o")
+            assert dialog.save_current_agent()
+
+            with patch.object(content_api, "update_agent") as update:
+                dialog.model_combo.showPopup()
+                dialog.model_combo.hidePopup()
+                assert dialog.model_combo.count() == 2
+                assert dialog.model_combo.currentText() == "gpt-4o"
+                assert dialog.save_current_agent()
+                update.assert_not_called()
+
+    def test_unchanged_agent_is_not_saved(self, qapp, db_session, dialog_cls):
+        """Saving without editing the form should skip the database write."""
+        from campaign_master.content import api as content_api
+
+        with patch("campaign_master.gui.dialogs.agent_settings.get_provider", side_effect=ValueError):
+            dialog = dialog_cls()
+            dialog.add_agent()
+            with patch.object(content_api, "update_agent") as update:
+                assert dialog.save_current_agent()
+                update.assert_not_called()
+
+                dialog.name_edit.setText("Renamed")
+                assert dialog.save_current_agent()
+                assert update.call_count == 1
+
+                assert dialog.save_current_agent()
+                assert update.call_count == 1
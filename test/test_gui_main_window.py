@@ -0,0 +1,666 @@
+"""Tests for the CampaignMasterWindow."""
+
+import gc
+import os
+import subprocess
+import sys
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+
+def _can_create_qapp() -> bool:
+    """Check whether QApplication can be created without aborting the process."""
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import os; os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen'); "
+                "from PySide6.QtWidgets import QApplication; QApplication([])",
+            ],
+            timeout=10,
+            capture_output=True,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+_gui_available = _can_create_qapp()
+pytestmark = pytest.mark.skipif(not _gui_available, reason="Cannot create QApplication")
+
+if _gui_available:
+    if "QT_QPA_PLATFORM" not in os.environ and not os.environ.get("DISPLAY"):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from campaign_master.content import api as content_api
+from campaign_master.content import planning
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Module-scoped QApplication for all GUI tests."""
+    if "QT_QPA_PLATFORM" not in os.environ and not os.environ.get("DISPLAY"):
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def window(qapp, db_session):
+    """A main window backed by the test database."""
+    from campaign_master.gui.main_window import CampaignMasterWindow
+
+    win = CampaignMasterWindow()
+    yield win
+    win.deleteLater()
+
+
+def _flush_events(qapp):
+    """Run deferred single-shot callbacks and deleteLater requests."""
+    qapp.processEvents()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+
+def _wait_for_tasks(qapp):
+    """Let thread pool tasks finish and deliver their queued results."""
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+
+class TestActions:
+    """Tests for the window's menu actions."""
+
+    def test_shortcuts(self, qapp, window):
+        """Actions should carry their keyboard shortcuts."""
+        assert window.new_action.shortcut() == QtGui.QKeySequence(QtGui.QKeySequence.StandardKey.New)
+        assert window.save_action.shortcut() == QtGui.QKeySequence(QtGui.QKeySequence.StandardKey.Save)
+        assert window.export_action.shortcut().toString() == "Ctrl+Shift+S"
+        assert window.load_execution_action.shortcut().toString() == "Ctrl+Shift+O"
+
+    def test_window_icon_loaded_once(self, qapp, window):
+        """Every window should reuse the icon decoded for the first one."""
+        from campaign_master.gui.main_window import CampaignMasterWindow
+
+        assert CampaignMasterWindow._window_icon() is CampaignMasterWindow._window_icon()
+        assert not window.windowIcon().isNull()
+
+
+class TestEditorLifecycle:
+    """Tests for installing and replacing the central editor."""
+
+    def test_new_campaign_is_deferred(self, qapp, window):
+        """The editor should be built on the next event loop pass."""
+        window.new_campaign()
+        assert window.current_editor is None
+
+        _flush_events(qapp)
+        assert window.central_widget.currentWidget() is window.current_editor
+        assert window.save_action.isEnabled()
+        assert window.export_action.isEnabled()
+
+    def test_replaced_editor_is_disposed(self, qapp, window):
+        """Opening a second editor should remove the first from the stack."""
+        window.new_campaign()
+        _flush_events(qapp)
+        first = window.current_editor
+        destroyed = []
+        first.destroyed.connect(lambda: destroyed.append(True))
+
+        window.new_campaign()
+        _flush_events(qapp)
+
+        assert window.current_editor is not first
+        assert window.central_widget.count() == 1  # Only the current editor
+        assert destroyed
+
+    def test_welcome_screen_built_on_first_show(self, qapp, window):
+        """The welcome screen should wait for the window to be shown."""
+        assert window.welcome_screen is None
+        assert window.central_widget.count() == 0
+
+        window.show()
+        qapp.processEvents()
+        assert window.central_widget.currentWidget() is window.welcome_screen
+
+    def test_welcome_hint_uses_native_shortcuts(self, qapp, window):
+        """The shortcut hint should show the platform's bindings for New, Open and Import."""
+        window.show()
+        qapp.processEvents()
+        hint = window.welcome_screen.findChild(QtWidgets.QLabel, "ShortcutsHint").text()
+        native = QtGui.QKeySequence.SequenceFormat.NativeText
+        for action in (window.new_action, window.load_action, window.import_action):
+            assert action.shortcut().toString(native) in hint
+
+    def test_welcome_screen_skipped_when_editor_open(self, qapp, window):
+        """Opening an editor before the first show should never build the welcome screen."""
+        window._open_campaign_editor(planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1)))
+
+        window.show()
+        qapp.processEvents()
+        assert window.welcome_screen is None
+        assert window.central_widget.currentWidget() is window.current_editor
+
+    def test_execution_editor_disables_export(self, qapp, window):
+        """Only campaign plans can be exported, so opening an execution should disable Export."""
+        window.new_campaign()
+        _flush_events(qapp)
+        assert window.export_action.isEnabled()
+
+        window.new_execution()
+        assert window.save_action.isEnabled()
+        assert not window.export_action.isEnabled()
+
+    def test_editor_built_on_first_show(self, qapp, window):
+        """The campaign editor's widget tree should wait until it is shown."""
+        window.new_campaign()
+        _flush_events(qapp)
+        editor = window.current_editor
+        assert not editor._built
+
+        window.show()
+        qapp.processEvents()
+        assert editor._built
+        assert editor.title.isVisible()
+
+    def test_unshown_editor_builds_on_export(self, qapp, window):
+        """Exporting an editor that was never shown should still read its form."""
+        campaign = planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1), title="Hidden")
+        window._open_campaign_editor(campaign)
+
+        assert window.current_editor.export_content().title == "Hidden"
+
+
+class TestExportCampaign:
+    """Tests for exporting the open campaign to a JSON file."""
+
+    def test_export_omits_defaults_and_round_trips(self, qapp, window, tmp_path):
+        """Export should write only non-default fields, leave no temporary file, and import back intact."""
+        campaign = planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1), title="Sparse")
+        window._open_campaign_editor(campaign)
+        path = tmp_path / "campaign.json"
+
+        with (
+            patch.object(QtWidgets.QFileDialog, "getSaveFileName", return_value=(str(path), "")),
+            patch.object(QtWidgets.QMessageBox, "information") as information,
+        ):
+            window.export_campaign()
+            assert not window.export_action.isEnabled()
+            _wait_for_tasks(qapp)
+
+        information.assert_called_once()
+        assert window.export_action.isEnabled()
+        assert list(tmp_path.iterdir()) == [path]
+        data = path.read_text(encoding="utf-8")
+        assert '"title": "Sparse"' in data
+        assert '"setting"' not in data
+        assert '"characters"' not in data
+
+        from campaign_master.gui.main_window import _read_campaign_file
+
+        restored = _read_campaign_file(str(path))
+        assert restored.title == "Sparse"
+        assert restored.characters == []
+
+    def test_exported_snapshot_is_released(self, qapp, window, tmp_path):
+        """The campaign exported for writing should not outlive the export."""
+        window._open_campaign_editor(planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1)))
+        editor = window.current_editor
+        snapshots = []
+        export_content = editor.export_content
+
+        def record_export():
+            snapshot = export_content()
+            snapshots.append(weakref.ref(snapshot))
+            return snapshot
+
+        with (
+            patch.object(editor, "export_content", side_effect=record_export),
+            patch.object(QtWidgets.QFileDialog, "getSaveFileName", return_value=(str(tmp_path / "c.json"), "")),
+            patch.object(QtWidgets.QMessageBox, "information"),
+        ):
+            window.export_campaign()
+            _wait_for_tasks(qapp)
+
+        gc.collect()
+        assert len(snapshots) == 1
+        assert snapshots[0]() is None
+
+
+class TestImportCampaign:
+    """Tests for importing a campaign from a JSON file."""
+
+    def test_import_utf8_json(self, qapp, window, tmp_path):
+        """A UTF-8 campaign file should be parsed and opened in an editor."""
+        campaign = planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1), title="Drachenhöhle")
+        path = tmp_path / "campaign.json"
+        path.write_text(campaign.model_dump_json(), encoding="utf-8")
+
+        with patch.object(QtWidgets.QFileDialog, "getOpenFileName", return_value=(str(path), "")):
+            window.import_campaign()
+        _wait_for_tasks(qapp)
+
+        assert window.current_editor is not None
+        assert window.current_editor.campaign_plan.title == "Drachenhöhle"
+
+    def test_import_invalid_file_is_reported(self, qapp, window, tmp_path):
+        """A file that fails to parse should be reported without opening an editor."""
+        path = tmp_path / "broken.json"
+        path.write_bytes(b"{not json")
+
+        with (
+            patch.object(QtWidgets.QFileDialog, "getOpenFileName", return_value=(str(path), "")),
+            patch.object(QtWidgets.QMessageBox, "critical") as critical,
+        ):
+            window.import_campaign()
+            _wait_for_tasks(qapp)
+
+        critical.assert_called_once()
+        assert window.current_editor is None
+
+    @pytest.mark.parametrize(
+        "answer", [QtWidgets.QMessageBox.StandardButton.Yes, QtWidgets.QMessageBox.StandardButton.No]
+    )
+    def test_large_import_asks_first(self, qapp, window, tmp_path, answer):
+        """Files over the large-file threshold should be imported only after the user confirms."""
+        campaign = planning.CampaignPlan(obj_id=planning.ID(prefix="CampPlan", numeric=1), title="Huge")
+        path = tmp_path / "campaign.json"
+        path.write_text(campaign.model_dump_json(), encoding="utf-8")
+
+        with (
+            patch("campaign_master.gui.main_window.LARGE_IMPORT_FILE_SIZE", 16),
+            patch.object(QtWidgets.QFileDialog, "getOpenFileName", return_value=(str(path), "")),
+            patch.object(QtWidgets.QMessageBox, "question", return_value=answer) as question,
+        ):
+            window.import_campaign()
+            _wait_for_tasks(qapp)
+
+        question.assert_called_once()
+        if answer == QtWidgets.QMessageBox.StandardButton.Yes:
+            assert window.current_editor.campaign_plan.title == "Huge"
+        else:
+            assert window.current_editor is None
+
+
+class TestDatabaseTasks:
+    """Tests for campaign database I/O on the thread pool."""
+
+    def test_save_new_campaign(self, qapp, window):
+        """Saving a new campaign should create it in the background and report success."""
+        window.new_campaign()
+        _flush_events(qapp)
+        with patch.object(QtWidgets.QMessageBox, "information") as information:
+            window.save_campaign()
+            assert not window.save_action.isEnabled()
+            _wait_for_tasks(qapp)
+
+        information.assert_called_once()
+        assert window.save_action.isEnabled()
+        assert window.current_editor.campaign_plan is not None
+        assert len(content_api.retrieve_objects(planning.CampaignPlan)) == 1
+        assert not window._pending_tasks
+
+    def test_finished_workers_are_released(self, qapp, window):
+        """Workers, their signals and whatever their task captured should be freed once results arrive."""
+        from campaign_master.gui import main_window
+
+        class Payload:
+            pass
+
+        refs = []
+        original = main_window.BackgroundTaskWorker
+
+        def make_worker(task):
+            worker = original(task)
+            refs.extend([weakref.ref(worker), weakref.ref(worker.signals)])
+            return worker
+
+        with patch.object(main_window, "BackgroundTaskWorker", side_effect=make_worker):
+            for _ in range(3):
+                payload = Payload()
+                refs.append(weakref.ref(payload))
+                window._run_background_task(lambda payload=payload: payload, lambda _: None, lambda _: None)
+            del payload
+            _wait_for_tasks(qapp)
+
+        gc.collect()
+        assert not window._pending_tasks
+        assert len(refs) == 9
+        assert all(ref() is None for ref in refs)
+
+    def test_saved_snapshot_is_released(self, qapp, window):
+        """The campaign exported for a save should not outlive the save."""
+        campaign = content_api.create_object(planning.CampaignPlan)
+        window._open_campaign_editor(campaign)
+        editor = window.current_editor
+        snapshots = []
+        export_content = editor.export_content
+
+        def record_export():
+            snapshot = export_content()
+            snapshots.append(weakref.ref(snapshot))
+            return snapshot
+
+        with (
+            patch.object(editor, "export_content", side_effect=record_export),
+            patch.object(QtWidgets.QMessageBox, "information"),
+        ):
+            window.save_campaign()
+            _wait_for_tasks(qapp)
+
+        gc.collect()
+        assert len(snapshots) == 1
+        assert snapshots[0]() is None
+
+    def test_load_with_no_campaigns(self, qapp, window):
+        """Loading from an empty database should say so once the query returns."""
+        with patch.object(QtWidgets.QMessageBox, "information") as information:
+            window.load_campaign()
+            assert not window.load_action.isEnabled()
+            _wait_for_tasks(qapp)
+
+        information.assert_called_once()
+        assert window.load_action.isEnabled()
+        assert window._load_progress is None
+
+    def test_load_opens_picked_campaign(self, qapp, window):
+        """Accepting the picker should load the chosen campaign in full and open it."""
+        campaign = content_api.create_object(planning.CampaignPlan)
+        assert isinstance(campaign, planning.CampaignPlan)
+        campaign.title = "Picked"
+        content_api.update_object(campaign)
+
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Accepted):
+            window.load_campaign()
+            _wait_for_tasks(qapp)
+            _wait_for_tasks(qapp)
+
+        assert window.current_editor is not None
+        assert window.current_editor.campaign_plan.obj_id == campaign.obj_id
+        assert window.current_editor.campaign_plan.title == "Picked"
+
+    def test_load_dialog_is_reused(self, qapp, window):
+        """Reopening the picker should reuse the dialog and show the latest campaigns."""
+        content_api.create_object(planning.CampaignPlan)
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.load_campaign()
+            _wait_for_tasks(qapp)
+            dialog = window._load_dialog
+
+            content_api.create_object(planning.CampaignPlan)
+            window.load_campaign()
+            _wait_for_tasks(qapp)
+
+        assert window._load_dialog is dialog
+        assert window._campaign_model.rowCount() == 2
+        assert window._campaign_list_view.currentIndex().row() == 0
+        assert window._campaign_delete_button.isEnabled()
+
+    def test_delete_from_picker(self, qapp, window):
+        """Deleting in the picker should remove the campaign from the database and the list."""
+        keep = content_api.create_object(planning.CampaignPlan)
+        content_api.create_object(planning.CampaignPlan)
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.on_campaigns_loaded(content_api.retrieve_campaign_summaries())
+
+        window._campaign_list_view.setCurrentIndex(window._campaign_model.index(1))
+        with patch.object(QtWidgets.QMessageBox, "question", return_value=QtWidgets.QMessageBox.StandardButton.Yes):
+            window._on_delete_selected_campaign()
+
+        assert window._campaign_model.rowCount() == 1
+        assert [obj_id for obj_id, _, _ in content_api.retrieve_campaign_summaries()] == [keep.obj_id]
+
+    def test_delete_several_from_picker(self, qapp, window):
+        """Deleting a multi-selection should remove every selected campaign with one confirmation."""
+        campaigns = [content_api.create_object(planning.CampaignPlan) for _ in range(3)]
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.on_campaigns_loaded(content_api.retrieve_campaign_summaries())
+
+        selection = window._campaign_list_view.selectionModel()
+        selection.clearSelection()
+        for row in (0, 2):
+            selection.select(window._campaign_model.index(row), QtCore.QItemSelectionModel.SelectionFlag.Select)
+        with patch.object(
+            QtWidgets.QMessageBox, "question", return_value=QtWidgets.QMessageBox.StandardButton.Yes
+        ) as question:
+            window._on_delete_selected_campaign()
+
+        question.assert_called_once()
+        assert window._campaign_model.rowCount() == 1
+        assert [obj_id for obj_id, _, _ in content_api.retrieve_campaign_summaries()] == [campaigns[1].obj_id]
+
+    def test_ok_requires_single_selection(self, qapp, window):
+        """OK should only be enabled while exactly one campaign is selected."""
+        for _ in range(3):
+            content_api.create_object(planning.CampaignPlan)
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.on_campaigns_loaded(content_api.retrieve_campaign_summaries())
+        assert window._campaign_ok_button.isEnabled()
+
+        selection = window._campaign_list_view.selectionModel()
+        selection.select(window._campaign_model.index(2), QtCore.QItemSelectionModel.SelectionFlag.Select)
+        assert not window._campaign_ok_button.isEnabled()
+        assert window._campaign_delete_button.isEnabled()
+
+        selection.clearSelection()
+        assert not window._campaign_ok_button.isEnabled()
+        assert not window._campaign_delete_button.isEnabled()
+
+    def test_accept_opens_selected_not_current_row(self, qapp, window):
+        """OK should open the selected campaign even when another row holds the current index."""
+        campaigns = [content_api.create_object(planning.CampaignPlan) for _ in range(2)]
+
+        def pick_second_row():
+            selection = window._campaign_list_view.selectionModel()
+            flags = QtCore.QItemSelectionModel.SelectionFlag
+            selection.select(window._campaign_model.index(1), flags.ClearAndSelect)
+            selection.setCurrentIndex(window._campaign_model.index(0), flags.NoUpdate)
+            return QtWidgets.QDialog.DialogCode.Accepted
+
+        with patch.object(QtWidgets.QDialog, "exec", side_effect=pick_second_row):
+            window.load_campaign()
+            _wait_for_tasks(qapp)
+            _wait_for_tasks(qapp)
+
+        assert window.current_editor.campaign_plan.obj_id == campaigns[1].obj_id
+
+    def test_failed_row_removal_restores_repaint(self, qapp, window):
+        """The picker should repaint again even if removing a deleted row fails."""
+        content_api.create_object(planning.CampaignPlan)
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.on_campaigns_loaded(content_api.retrieve_campaign_summaries())
+
+        with (
+            patch.object(QtWidgets.QMessageBox, "question", return_value=QtWidgets.QMessageBox.StandardButton.Yes),
+            patch.object(QtWidgets.QMessageBox, "critical") as critical,
+            patch.object(window._campaign_model, "remove_row", side_effect=RuntimeError("boom")),
+        ):
+            window._on_delete_selected_campaign()
+
+        critical.assert_called_once()
+        assert window._campaign_list_view.updatesEnabled()
+
+    def test_load_failure_is_reported(self, qapp, window):
+        """A database error during load should be shown to the user."""
+        with (
+            patch.object(content_api, "retrieve_campaign_summaries", side_effect=RuntimeError("boom")),
+            patch.object(QtWidgets.QMessageBox, "critical") as critical,
+        ):
+            window.load_campaign()
+            _wait_for_tasks(qapp)
+
+        critical.assert_called_once()
+        assert "boom" in critical.call_args.args[2]
+
+
+class TestExecutionTasks:
+    """Tests for execution database I/O on the thread pool."""
+
+    def test_save_new_execution(self, qapp, window):
+        """Saving a new execution should create it in the background and report success."""
+        from campaign_master.content import executing
+
+        window.new_execution()
+        with patch.object(QtWidgets.QMessageBox, "information") as information:
+            window.save_campaign()
+            assert not window.save_action.isEnabled()
+            _wait_for_tasks(qapp)
+
+        information.assert_called_once()
+        assert window.save_action.isEnabled()
+        assert window.current_editor.execution is not None
+        assert len(content_api.retrieve_objects(executing.CampaignExecution)) == 1
+
+    def test_load_opens_picked_execution(self, qapp, window):
+        """Accepting the picker should open the chosen execution."""
+        from campaign_master.content import executing
+
+        execution = content_api.create_object(executing.CampaignExecution)
+        assert isinstance(execution, executing.CampaignExecution)
+
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Accepted):
+            window.load_execution()
+            assert not window.load_execution_action.isEnabled()
+            _wait_for_tasks(qapp)
+            _wait_for_tasks(qapp)
+
+        assert window.load_execution_action.isEnabled()
+        assert window.current_editor.execution.obj_id == execution.obj_id
+
+    def test_load_dialog_is_reused(self, qapp, window):
+        """Reopening the execution picker should reuse the dialog and show the latest executions."""
+        from campaign_master.content import executing
+
+        content_api.create_object(executing.CampaignExecution)
+        with patch.object(QtWidgets.QDialog, "exec", return_value=QtWidgets.QDialog.DialogCode.Rejected):
+            window.load_execution()
+            _wait_for_tasks(qapp)
+            dialog = window._load_execution_dialog
+
+            content_api.create_object(executing.CampaignExecution)
+            window.load_execution()
+            _wait_for_tasks(qapp)
+
+        assert window._load_execution_dialog is dialog
+        assert window._execution_model.rowCount() == 2
+        assert window._execution_list_view.currentIndex().row() == 0
+
+
+class TestDefaultAgentMenu:
+    """Tests for the Agents > Set Default Agent submenu."""
+
+    def _create_agent(self, name: str, is_default: bool = False) -> planning.AgentConfig:
+        agent = content_api.create_object(planning.AgentConfig)
+        assert isinstance(agent, planning.AgentConfig)
+        agent.name = name
+        agent.provider_type = "ollama"
+        agent.is_default = is_default
+        content_api.update_object(agent)
+        return agent
+
+    def _default_ids(self) -> list[planning.ID]:
+        agents = content_api.retrieve_objects(planning.AgentConfig)
+        return [a.obj_id for a in agents if isinstance(a, planning.AgentConfig) and a.is_default]
+
+    def test_triggering_entry_sets_default(self, qapp, window):
+        """Picking an agent from the submenu should make it the only default."""
+        self._create_agent("First", is_default=True)
+        second = self._create_agent("Second")
+        window.update_default_agent_menu()
+
+        actions = window.default_agent_menu.actions()
+        assert [a.text() for a in actions] == ["First", "Second"]
+        actions[1].trigger()
+
+        assert actions[1].isChecked() and not actions[0].isChecked()
+        assert self._default_ids() == [second.obj_id]
+
+        # The menu already reflects the switch, so a refresh keeps its entries
+        window.update_default_agent_menu()
+        assert window.default_agent_menu.actions() == actions
+
+    def test_unchanged_agents_keep_menu(self, qapp, window):
+        """Refreshing with unchanged agents should keep the existing entries; changes rebuild them."""
+        agent = self._create_agent("First")
+        window.update_default_agent_menu()
+        before = window.default_agent_menu.actions()
+
+        window.update_default_agent_menu()
+        assert window.default_agent_menu.actions() == before
+
+        agent.name = "Renamed"
+        content_api.update_object(agent)
+        window.update_default_agent_menu()
+        assert [a.text() for a in window.default_agent_menu.actions()] == ["Renamed"]
+
+
+class TestCampaignListModel:
+    """Tests for the Load dialog's campaign list model."""
+
+    def test_rows_are_formatted_on_demand(self, qapp):
+        """Display text and the (obj_id, title) payload should come from the raw rows."""
+        from campaign_master.gui.main_window import CampaignListModel
+
+        first_id = planning.ID(prefix="CampPlan", numeric=1)
+        second_id = planning.ID(prefix="CampPlan", numeric=2)
+        model = CampaignListModel([(first_id, "First", "A summary"), (second_id, "", "")])
+
+        assert model.rowCount() == 2
+        assert model.data(model.index(0)) == f"First (ID: {first_id})\n  A summary"
+        assert model.data(model.index(1)) == f"Untitled Campaign (ID: {second_id})"
+        assert model.data(model.index(1), QtCore.Qt.ItemDataRole.UserRole) == (second_id, "")
+
+        model.remove_row(0)
+        assert model.rowCount() == 1
+        assert model.data(model.index(0), QtCore.Qt.ItemDataRole.UserRole) == (second_id, "")
+
+    def test_new_rows_are_reformatted(self, qapp):
+        """Refilling the model should not reuse text formatted for the previous rows."""
+        from campaign_master.gui.main_window import CampaignListModel
+
+        obj_id = planning.ID(prefix="CampPlan", numeric=1)
+        model = CampaignListModel([(obj_id, "Before", "")])
+        assert model.data(model.index(0)) == f"Before (ID: {obj_id})"
+
+        model.set_rows([(obj_id, "After", "")])
+        assert model.data(model.index(0)) == f"After (ID: {obj_id})"
+
+
+class TestExecutionListModel:
+    """Tests for the Load Execution dialog's list model."""
+
+    def test_rows_are_formatted_on_demand(self, qapp):
+        """Display text and the obj_id payload should come from the raw rows."""
+        from campaign_master.gui.main_window import ExecutionListModel
+
+        first_id = planning.ID(prefix="EX", numeric=1)
+        second_id = planning.ID(prefix="EX", numeric=2)
+        model = ExecutionListModel([(first_id, "Session 1", "2025-01-04"), (second_id, "", "")])
+
+        assert model.rowCount() == 2
+        assert model.data(model.index(0)) == f"Session 1 (ID: {first_id}) - 2025-01-04"
+        assert model.data(model.index(1)) == f"Untitled Session (ID: {second_id})"
+        assert model.data(model.index(1), QtCore.Qt.ItemDataRole.UserRole) == second_id
+
+
+class TestSummaryPreview:
+    """Tests for the Load dialog's summary truncation."""
+
+    def test_short_summary_is_unchanged(self):
+        """Summaries within the limit should be shown in full."""
+        from campaign_master.gui.main_window import SUMMARY_PREVIEW_LENGTH, _summary_preview
+
+        summary = "x" * SUMMARY_PREVIEW_LENGTH
+        assert _summary_preview(summary) == summary
+
+    def test_long_summary_is_truncated(self):
+        """Summaries over the limit should be cut and end with an ellipsis."""
+        from campaign_master.gui.main_window import SUMMARY_PREVIEW_LENGTH, _summary_preview
+
+        assert _summary_preview("x" * (SUMMARY_PREVIEW_LENGTH + 1)) == "x" * SUMMARY_PREVIEW_LENGTH + "..."